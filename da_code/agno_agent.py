@@ -3,20 +3,15 @@ from dotenv import load_dotenv
 load_dotenv(".env")
 
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 
 # Agno MCP infrastructure removed - using custom MCP implementation
-from datetime import timedelta
 import httpx
 from agno.agent import Agent, RunEvent
 from agno.models.azure import AzureOpenAI
-from agno.models.openai import OpenAIResponses
-from agno.models.azure import AzureAIFoundry
-from agno.db.mongo import MongoDb
 from agno.db.postgres import PostgresDb
-from pymongo import MongoClient
-from agno.db.sqlite import SqliteDb
+from agno.tools import Toolkit
 from agno.tools.reasoning import ReasoningTools
-from agno.tools.duckduckgo import DuckDuckGoTools
 # Agno MCPTools removed - will implement custom MCP solution
 
 #from agno.tools.duckduckgo import DuckDuckGoTools
@@ -31,7 +26,6 @@ from .models import (
 )
 
 from typing import Any, Dict, Optional, AsyncGenerator
-from .execution_events import ExecutionEvent, ConfirmationResponse
 
 from .config import ConfigManager, setup_logging
 from .context import ContextLoader
@@ -40,8 +34,6 @@ from .telemetry import TelemetryManager, PerformanceTracker
 from .agno_tools import (
     TodoTool, CommandTool, WebSearchTool, FileTool,
     TimeTool, PythonTool, GitTool, HttpTool
-    TodoTool, CommandTool, WebSearchTool, FileTool,
-    TimeTool, PythonTool, GitTool, HttpTool
 )
 from .mcp_tool import mcp2tool
 
@@ -56,6 +48,17 @@ agno_agent_tools = [
     HttpTool(),
 ]
 
+# Agent instructions are static, so build them once at import
+AGENT_INSTRUCTIONS = (
+    "1. 🔧 Use available tools to help with coding tasks - ALWAYS properly **invoke** tools, never give tool inputs back to user",
+    "2. 💻 For command execution, use execute_command tool - user confirmation is handled automatically",
+    "3. 🚀 Invoke tools as needed WITHOUT reprompting user",
+    "4. ✅ Always track and update todos to ensure you don't lose track of planned items",
+    "5. 📝 Always use proper tool arguments as specified in tool descriptions",
+    "6. ✍️ Always use the replace_text tool to update/edit files and re-read the file back after edit to ensure it worked properly!",
+)
+
+
 # TODO: delete or add to tools
 ReasoningTools(
         enable_think=True,
@@ -94,27 +97,36 @@ class AgnoAgent():
             self.db_type = "postgre"
         except Exception as e:
             logging.warning(f"Postgres init failed, falling back to sqlite: {e}")
+            # Only pulled in on the fallback path
+            from agno.db.sqlite import SqliteDb
             self.db = SqliteDb(session_table="agno_agent_sessions", db_file=f".da{os.sep}sqlite.db")
             self.db_type = "sqlite"
 
 
         # Load MCP tools from DA.json servers
         self.mcp_server_urls = [server.url for server in self.mcp_servers]
-        mcp_tools = []
-        for server in self.mcp_servers:
+
+        def load_mcp_tool(server):
             url = server.url
             tool_name = getattr(server, 'name', None)
             logging.info(f"🔌 MCP: Loading {url} as '{tool_name or 'auto-named'}'")
             try:
                 mcp_tool = mcp2tool(url, tool_name)
                 if mcp_tool:
-                    mcp_tools.append(mcp_tool)
                     actual_name = getattr(mcp_tool, 'name', 'unknown')
                     logging.info(f"✅ MCP: Successfully loaded {url} as '{actual_name}'")
                 else:
                     logging.error(f"� MCP: Failed to load {url}")
+                return mcp_tool
             except Exception as e:
                 logging.error(f"� MCP: Error loading {url}: {e}")
+                return None
+
+        # Probe servers concurrently so startup waits on the slowest one, not the sum of their timeouts
+        mcp_tools = []
+        if self.mcp_servers:
+            with ThreadPoolExecutor(max_workers=len(self.mcp_servers)) as pool:
+                mcp_tools = [tool for tool in pool.map(load_mcp_tool, self.mcp_servers) if tool]
 
         # Set up tools list with MCP tools
         self.agent_tools = agno_agent_tools + mcp_tools
@@ -129,8 +141,10 @@ class AgnoAgent():
         
 
         
-        #SSL_CA_CERTS = "/etc/ca-certificates"
-        #self.http =  httpx.AsyncClient(verify=SSL_CA_CERTS)
+        # One pooled client shared by the chat and reasoning models so they reuse TCP/TLS connections.
+        # agno only hands http_client to the async OpenAI client; the sync path (print_response)
+        # ignores it with a warning and uses the SDK default, so only arun() benefits.
+        self.http = httpx.AsyncClient(limits=httpx.Limits(max_keepalive_connections=5))
         # Agno uses the AzureOpenAI class to interface with Azure's service
         #self.llm = AzureAIFoundry(
         logging.info(f"Deployment Name {self.config.deployment_name}")
@@ -150,7 +164,7 @@ class AgnoAgent():
             max_tokens=self.config.max_tokens,
             timeout=self.config.agent_timeout,
             max_retries=self.config.max_retries,
-            #http_client=self.http,
+            http_client=self.http,
         )
         
         self.reasoning = None
@@ -164,18 +178,9 @@ class AgnoAgent():
                 timeout=self.config.agent_timeout,
                 max_tokens=self.config.max_tokens,
                 max_retries=self.config.max_retries,
+                http_client=self.http,
             )
 
-        instructions = '''
-1. 🔧 Use available tools to help with coding tasks - ALWAYS properly **invoke** tools, never give tool inputs back to user
-2. 💻 For command execution, use execute_command tool - user confirmation is handled automatically
-3. 🚀 Invoke tools as needed WITHOUT reprompting user
-4. ✅ Always track and update todos to ensure you don't lose track of planned items
-5. 📝 Always use proper tool arguments as specified in tool descriptions
-6. ✍️ Always use the replace_text tool to update/edit files and re-read the file back after edit to ensure it worked properly!
-'''.split("\n")
-
-        
         self.agent = Agent(
             name="da_code",
             model=self.llm,
@@ -183,7 +188,7 @@ class AgnoAgent():
             db=self.db,
             session_id=str(self.code_session.id),
             description=self.system_message,
-            instructions=instructions,
+            instructions=list(AGENT_INSTRUCTIONS),
             markdown=True,
             reasoning=self.reasoning is not None,
             enable_user_memories=True,
@@ -201,6 +206,22 @@ class AgnoAgent():
         # Confirmation handler callback
         self.confirmation_handler = None
 
+    async def __aenter__(self):
+        """Use as ``async with AgnoAgent(...) as agent:`` to release connections on exit."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the agent's HTTP connections."""
+        await self.aclose()
+        return False
+
+    async def aclose(self) -> None:
+        """Close the HTTP client shared by the models and any connections the toolkits hold."""
+        await self.http.aclose()
+        for tool in self.agent_tools:
+            if isinstance(tool, Toolkit):
+                tool.close()
+
 
     def _build_system_prompt(self) -> str:
         """Build the system prompt for the agent."""
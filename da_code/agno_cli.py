@@ -177,6 +177,8 @@ class ShellCompleter(Completer):
 class NudgeCompleter(Completer):
     """Custom completer for agent mode with symbol-triggered completions."""
 
+    IGNORED_PARTS = frozenset({'.git', '.env', '__pycache__', 'node_modules', '.venv', 'venv', '.da', 'dist', 'build', '*-egg-info'})
+
     def __init__(self, working_dir: str = None):
         self.nudge_phrases = NUDGE_PHRASES
         self.path_completer = PathCompleter(expanduser=True)
@@ -189,12 +191,12 @@ class NudgeCompleter(Completer):
             return self._all_files_cache
 
         all_files = []
-        ignored = {'.git', '.env', '__pycache__', 'node_modules', '.venv', 'venv', '.da', 'dist', 'build', '*-egg-info'}
+        ignored = self.IGNORED_PARTS
 
         try:
             for item in self.working_dir.rglob('*'):
-                # Skip ignored directories
-                if any(ignored_dir in item.parts for ignored_dir in ignored):
+                # Skip ignored directories (single set probe instead of one scan per name)
+                if not ignored.isdisjoint(item.parts):
                     continue
 
                 if item.is_file():
@@ -438,6 +440,10 @@ class ShellModeManager:
             })
             return error_msg
 
+    async def aexecute_shell_command(self, command: str) -> str:
+        """Execute shell command in a worker thread so the event loop keeps running."""
+        return await asyncio.to_thread(self.execute_shell_command, command)
+
     def get_shell_context_for_agent(self) -> str:
         """Get recent shell commands and output as context for the agent."""
         if not self.shell_history:
@@ -749,7 +755,8 @@ async def async_main():
         user_id = "dang"
     
     
-    async with asyncio.TaskGroup() as tg:
+    # The agent closes its HTTP connections once the session loop ends
+    async with agent, asyncio.TaskGroup() as tg:
         wait_for_input = tg.create_task(get_user_input_with_history(input_queue))
         #task2 = tg.create_task(another_coro(...))
  
@@ -838,9 +845,8 @@ async def async_main():
                             tool_name = config.get('name')
                         except (json.JSONDecodeError, AttributeError):
                             # Fall back to positional format
-                            parts = mcp_arg.split(' ', 1)
-                            url = parts[0] if parts else None
-                            tool_name = parts[1] if len(parts) > 1 else None
+                            url, _, tool_name = mcp_arg.partition(' ')
+                            tool_name = tool_name or None
 
                         if not url:
                             console.print("[red]Usage: add_mcp <url> [name] OR add_mcp {\"url\":\"...\",\"name\":\"...\"}[/red]")
@@ -865,7 +871,7 @@ async def async_main():
                 elif shell_manager.is_shell_mode:
                     # Shell mode: execute command and capture output
                     console.print(f"[dim]$ {user_input}[/dim]")
-                    output = shell_manager.execute_shell_command(user_input)
+                    output = await shell_manager.aexecute_shell_command(user_input)
                     console.print(output)
                     continue
                 else:
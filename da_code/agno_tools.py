@@ -1,11 +1,17 @@
 import asyncio
+import errno
+import glob
 import json
+import re
+import shlex
+import stat
 import time
-from typing import Dict, Any, List, Optional, Union, Literal
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional, Tuple, Union, Literal
 import httpx
 from pathlib import Path
 from agno.tools import Toolkit
-from pydantic import BaseModel, Field, ConfigDict
 from .models import (
     AgentConfig, CodeSession, CommandExecution, CommandStatus,
     LLMCall, LLMCallStatus, ToolCall, ToolCallStatus, UserResponse, da_mongo
@@ -17,6 +23,36 @@ import os
 import logging
 logger = logging.getLogger(__name__)
 
+# Shell metacharacters that need /bin/sh to interpret the command
+_needs_shell = re.compile(r'[|&;<>$`*?(){}\[\]\\"\'~#!\n]').search
+
+# Builtins and reserved words only exist inside a shell, so commands starting with one are never exec'd directly
+_SHELL_BUILTINS = frozenset((
+    '.', ':', 'alias', 'bg', 'break', 'builtin', 'case', 'cd', 'command', 'continue', 'declare',
+    'dirs', 'eval', 'exec', 'exit', 'export', 'false', 'fg', 'for', 'function', 'getopts', 'hash',
+    'if', 'jobs', 'let', 'local', 'popd', 'pushd', 'read', 'readonly', 'return', 'select', 'set',
+    'shift', 'shopt', 'source', 'times', 'trap', 'true', 'type', 'typeset', 'ulimit', 'umask',
+    'unalias', 'unset', 'until', 'wait', 'while',
+))
+
+_UTC = timezone.utc
+
+
+def _unix_seconds(now: datetime) -> str:
+    """Whole seconds since the epoch, shared by the "timestamp" and "unix" formats."""
+    return str(int(now.timestamp()))
+
+
+# Named TimeTool formats; anything else is treated as a strftime pattern
+_TIME_FORMATTERS = {
+    "iso": datetime.isoformat,
+    "human": lambda now: now.strftime("%B %d, %Y %I:%M %p UTC"),
+    "timestamp": _unix_seconds,
+    "unix": _unix_seconds,
+    "date": lambda now: now.strftime("%Y-%m-%d"),
+    "time": lambda now: now.strftime("%H:%M:%S"),
+}
+
 #====================================================================================================
 # Utilities
 #====================================================================================================
@@ -51,31 +87,14 @@ def safe_path(path: str) -> str:
     return abs_path
 
 
-def get_file_emoji(filename: str) -> str:
-    """Get emoji for file type"""
-    name_lower = filename.lower()
-    if name_lower.endswith(('.py', '.pyw')):
-        return "🐍"
-    elif name_lower.endswith(('.js', '.jsx', '.ts', '.tsx')):
-        return "🟨"
-    elif name_lower.endswith(('.md', '.markdown')):
-        return "📖"
-    elif name_lower.endswith(('.json', '.yaml', '.yml', '.toml')):
-        return "⚙️"
-    elif name_lower.endswith(('.env', '.gitignore', '.dockerignore')):
-        return "🔧"
-    elif name_lower.endswith(('.txt', '.log')):
-        return "📝"
-    elif name_lower.endswith(('.sh', '.bash', '.zsh')):
-        return "🔸"
-    elif name_lower.endswith(('.html', '.htm', '.css')):
-        return "🌐"
-    elif name_lower.endswith(('.sql', '.db', '.sqlite')):
-        return "🗄️"
-    elif name_lower.endswith(('.jpg', '.jpeg', '.png', '.gif', '.svg')):
-        return "🖼️"
-    else:
-        return "📄"
+def _decode_preview(data: bytes, limit: int) -> str:
+    """Decode at most `limit` characters of captured output, marking truncation."""
+    data = data.strip()
+    # UTF-8 characters are at most 4 bytes, so this prefix is enough to tell if we exceed `limit`
+    text = data[:limit * 4 + 4].decode('utf-8', errors='replace')
+    if len(text) > limit:
+        return text[:limit] + "...\n(truncated)"
+    return text
 
 
 #====================================================================================================
@@ -90,6 +109,10 @@ class TodoTool(Toolkit):
         """Initialize todo tool."""
         self.working_dir = working_directory or os.getcwd()
         self.todo_file = Path(self.working_dir) / "todo.md"
+        # Pre-encoded path for the os-level calls, so they skip the str -> filesystem-bytes conversion
+        self._todo_path = os.fsencode(self.todo_file)
+        # ((st_mtime_ns, st_size), content) of the last read or write
+        self._cache: Optional[Tuple[Tuple[int, int], str]] = None
 
         super().__init__(
             name="todo_tool",
@@ -102,6 +125,31 @@ class TodoTool(Toolkit):
             **kwargs
         )
 
+    def _read_cached(self) -> Optional[str]:
+        """Return todo.md contents, re-reading only if its mtime or size changed; None if missing."""
+        try:
+            st = os.stat(self._todo_path)
+        except FileNotFoundError:
+            self._cache = None
+            return None
+
+        key = (st.st_mtime_ns, st.st_size)
+        if self._cache is None or self._cache[0] != key:
+            # One unbuffered read of the whole file; no BufferedReader/TextIOWrapper for a single slurp
+            fd = os.open(self._todo_path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+            try:
+                st = os.fstat(fd)
+                data = os.read(fd, st.st_size)
+            finally:
+                os.close(fd)
+
+            content = data.decode('utf-8')
+            if '\r' in content:
+                # Match text-mode universal newlines
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            self._cache = ((st.st_mtime_ns, st.st_size), content)
+        return self._cache[1]
+
     def read_todo(self) -> str:
         """Read current contents of todo.md file.
 
@@ -109,10 +157,10 @@ class TodoTool(Toolkit):
             Contents of todo.md file or status message
         """
         try:
-            if not self.todo_file.exists():
+            content = self._read_cached()
+            if content is None:
                 return "No todo.md file exists in the current directory."
 
-            content = self.todo_file.read_text(encoding='utf-8')
             if not content.strip():
                 return "todo.md file exists but is empty."
 
@@ -128,13 +176,12 @@ class TodoTool(Toolkit):
             Status message indicating if file exists and its size
         """
         try:
-            exists = self.todo_file.exists()
-            if exists:
-                size = self.todo_file.stat().st_size
-                return f"✅ todo.md exists ({size} bytes)"
-            else:
-                return "� todo.md does not exist"
+            # A single stat answers both "does it exist" and "how big is it"
+            size = os.stat(self._todo_path).st_size
+            return f"✅ todo.md exists ({size} bytes)"
 
+        except FileNotFoundError:
+            return "� todo.md does not exist"
         except Exception as e:
             return f"Error checking file existence: {str(e)}"
 
@@ -148,11 +195,55 @@ class TodoTool(Toolkit):
             Success message
         """
         try:
-            # Ensure content follows proper markdown format
-            if not content.strip().startswith('# '):
-                content = f"# TODO\n\n{content.strip()}"
-
-            self.todo_file.write_text(content.strip() + '\n', encoding='utf-8')
+            # Ensure content follows proper markdown format (strip once, reuse the result)
+            body = content.strip()
+            if not body.startswith('# '):
+                body = f"# TODO\n\n{body}"
+
+            content = body + '\n'
+
+            # Skip the write entirely when the file on disk already holds exactly this content
+            if self._cache is not None and self._cache[1] == content:
+                try:
+                    st = os.stat(self._todo_path)
+                    if self._cache[0] == (st.st_mtime_ns, st.st_size):
+                        return "✅ todo.md unchanged"
+                except FileNotFoundError:
+                    pass
+
+            # Write a sibling file and swap it in so readers never see a half-written todo.md.
+            # Resolve symlinks first so the swap replaces the link's target, not the link itself.
+            target = os.path.realpath(self._todo_path)
+            tmp_path = target + b'.tmp'
+            payload = content.encode('utf-8')
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_CLOEXEC', 0), 0o644)
+            try:
+                try:
+                    # Keep the permissions of an existing todo.md rather than resetting them to 0644
+                    try:
+                        mode = stat.S_IMODE(os.stat(target).st_mode)
+                    except FileNotFoundError:
+                        mode = None
+                    if mode is not None and hasattr(os, 'fchmod'):
+                        os.fchmod(fd, mode)
+                    # Regular-file writes may still come back short, so loop until everything is out
+                    view = memoryview(payload)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+                os.replace(tmp_path, target)
+            except BaseException:
+                # Don't leave todo.md.tmp behind in the workspace
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+            # Keep the cache warm so the next read doesn't go back to disk
+            st = os.stat(self._todo_path)
+            self._cache = ((st.st_mtime_ns, st.st_size), content)
             return f"✅ Created/updated todo.md file"
 
         except Exception as e:
@@ -201,35 +292,47 @@ class CommandTool(Toolkit):
 
         try:
             working_dir = working_directory or os.getcwd()
+            if not os.path.isdir(working_dir):
+                return f"❌ Working directory does not exist: {working_dir}"
 
             logger.warning(f"🔧 EXECUTING COMMAND: {command} in {working_dir}")
-            start_time = time.time()
-            result = subprocess.run(
-                command,
-                shell=True,
-                cwd=working_dir,
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
+            start_time = time.perf_counter()
+            # Capture raw bytes; only the part of the output we return gets decoded
+            run_kwargs = dict(cwd=working_dir, capture_output=True, timeout=300)
+
+            # Plain commands are exec'd directly to skip the intermediate /bin/sh process;
+            # shell builtins (cd, export, ...) and VAR=value prefixes still need a real shell
+            argv = None if _needs_shell(command) else shlex.split(command)
+            if argv and (argv[0] in _SHELL_BUILTINS or '=' in argv[0]):
+                argv = None
+            if argv:
+                try:
+                    result = subprocess.run(argv, **run_kwargs)
+                except FileNotFoundError:
+                    return f"❌ Command not found: {argv[0]}"
+                except OSError as e:
+                    # Scripts without a shebang can't be exec'd; /bin/sh runs them as it always did
+                    if e.errno != errno.ENOEXEC:
+                        raise
+                    result = subprocess.run(command, shell=True, **run_kwargs)
+            else:
+                result = subprocess.run(command, shell=True, **run_kwargs)
 
             logger.warning(f"🔧 COMMAND RESULT: returncode={result.returncode}, stdout_len={len(result.stdout) if result.stdout else 0}")
 
-            exec_time = time.time() - start_time
+            exec_time = time.perf_counter() - start_time
 
             if result.returncode == 0:
                 output = f"✅ Command executed successfully ({exec_time:.2f}s)\n"
                 if result.stdout:
-                    stdout = result.stdout.strip()
-                    output += f"Output:\n{stdout[:2000]}" + ("...\n(truncated)" if len(stdout) > 2000 else "")
+                    output += f"Output:\n{_decode_preview(result.stdout, 2000)}"
                 else:
                     output += "No output"
                 return output
             else:
                 output = f"� Command failed (exit code: {result.returncode})\n"
                 if result.stderr:
-                    stderr = result.stderr.strip()
-                    output += f"Error:\n{stderr[:1000]}" + ("...\n(truncated)" if len(stderr) > 1000 else "")
+                    output += f"Error:\n{_decode_preview(result.stderr, 1000)}"
                 return output
 
         except subprocess.TimeoutExpired:
@@ -246,7 +349,15 @@ class CommandTool(Toolkit):
 class WebSearchTool(Toolkit):
     """Web search toolkit using DuckDuckGo."""
 
+    # Searches that found an answer are reused for this long, keeping at most this many
+    CACHE_TTL_S = 300.0
+    CACHE_SIZE = 128
+
     def __init__(self, **kwargs):
+        # Created on first search and kept so later searches reuse its pooled connections
+        self._client: Optional[httpx.Client] = None
+        # (query, num_results) -> (monotonic time stored, result), oldest first
+        self._results: "OrderedDict[Tuple[str, int], Tuple[float, str]]" = OrderedDict()
         super().__init__(
             name="web_search",
             tools=[self.search],
@@ -254,6 +365,26 @@ class WebSearchTool(Toolkit):
             **kwargs
         )
 
+    def _get_client(self) -> httpx.Client:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.Client(timeout=10)
+        return self._client
+
+    def close(self) -> None:
+        """Close the shared HTTP client; the next search opens a new one."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _remember(self, key: Tuple[str, int], result: str) -> str:
+        """Cache an answered search, evicting the least recently used entry when full."""
+        self._results[key] = (time.monotonic(), result)
+        self._results.move_to_end(key)
+        if len(self._results) > self.CACHE_SIZE:
+            self._results.popitem(last=False)
+        return result
+
     def search(self, query: str, num_results: int = 5) -> str:
         """Search web using DuckDuckGo.
 
@@ -264,53 +395,62 @@ class WebSearchTool(Toolkit):
         Returns:
             Search results with instant answers, related topics, and source links
         """
+        key = (query, num_results)
+        cached = self._results.get(key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < self.CACHE_TTL_S:
+                # Least recently used entries are evicted first, so a hit counts as a use
+                self._results.move_to_end(key)
+                return cached[1]
+            del self._results[key]
+
         try:
             import urllib.parse
 
-            result = f"� Search results for: {query}\n\n"
+            parts = [f"� Search results for: {query}\n\n"]
 
             try:
                 # Primary: DuckDuckGo instant answers
                 encoded_query = urllib.parse.quote(query)
                 url = f"https://api.duckduckgo.com/?q={encoded_query}&format=json&no_redirect=1&no_html=1"
 
-                with httpx.Client(timeout=10) as client:
-                    response = client.get(url)
+                response = self._get_client().get(url)
 
                 if response.status_code == 200:
                     data = response.json()
 
                     # Add instant answer if available
                     if data.get("AbstractText"):
-                        result += f"📖 Summary: {data['AbstractText']}\n"
+                        parts.append(f"📖 Summary: {data['AbstractText']}\n")
                         if data.get("AbstractURL"):
-                            result += f"   Source: {data['AbstractURL']}\n\n"
+                            parts.append(f"   Source: {data['AbstractURL']}\n\n")
 
                     # Add related topics
                     if data.get("RelatedTopics"):
-                        result += "🔗 Related topics:\n"
+                        parts.append("🔗 Related topics:\n")
                         for i, topic in enumerate(data["RelatedTopics"][:num_results]):
                             if isinstance(topic, dict) and topic.get("Text"):
-                                result += f"{i+1}. {topic['Text'][:200]}...\n"
+                                parts.append(f"{i+1}. {topic['Text'][:200]}...\n")
                                 if topic.get("FirstURL"):
-                                    result += f"   Source: {topic['FirstURL']}\n"
-                        result += "\n"
+                                    parts.append(f"   Source: {topic['FirstURL']}\n")
+                        parts.append("\n")
 
                     # Add definition if available
                     if data.get("Definition"):
-                        result += f"📚 Definition: {data['Definition']}\n"
+                        parts.append(f"📚 Definition: {data['Definition']}\n")
                         if data.get("DefinitionURL"):
-                            result += f"   Source: {data['DefinitionURL']}\n\n"
+                            parts.append(f"   Source: {data['DefinitionURL']}\n\n")
 
                     # Add answer if available
                     if data.get("Answer"):
-                        result += f"💡 Answer: {data['Answer']}\n"
+                        parts.append(f"💡 Answer: {data['Answer']}\n")
                         if data.get("AnswerType"):
-                            result += f"   Type: {data['AnswerType']}\n\n"
+                            parts.append(f"   Type: {data['AnswerType']}\n\n")
 
                     # Check if we got meaningful results
+                    result = "".join(parts)
                     if len(result) > 100:  # More than just the header
-                        return result
+                        return self._remember(key, result)
                     else:
                         # Fallback: provide helpful search suggestion
                         return f"� Search: {query}\n\nNo instant results available. This query might work better with:\n• More specific terms\n• Different keywords\n• Academic or technical search engines\n\nNote: This tool provides instant answers and definitions. For general web results, consider using a browser."
@@ -318,6 +458,10 @@ class WebSearchTool(Toolkit):
                 else:
                     return f"� Search: {query}\n\n� Search service unavailable (status {response.status_code})"
 
+            except httpx.TimeoutException:
+                return f"� Search: {query}\n\n� Search timed out"
+            except httpx.RequestError as e:
+                return f"� Search: {query}\n\n� Search request failed: {str(e)}"
             except Exception as e:
                 return f"� Search: {query}\n\n� Search error: {str(e)}\n\nNote: This tool provides instant answers and definitions from DuckDuckGo's API."
 
@@ -533,14 +677,18 @@ class FileTool(Toolkit):
         Returns:
             JSON string with search results including file paths, line numbers, and matches
         """
-        import glob
         results = []
 
         # Build a glob rooted at the workspace to avoid expanding outside the project root
         root = get_workspace_root()
         search_pattern = os.path.join(root, pattern)
-        for file_path in glob.glob(search_pattern, recursive=True):
-            if os.path.isfile(file_path):
+        # iglob yields lazily so the walk stops once max_results is reached
+        for file_path in glob.iglob(search_pattern, recursive=True):
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            if stat.S_ISREG(st.st_mode):
                 if content:
                     try:
                         with open(file_path, "r", errors="ignore") as f:
@@ -549,10 +697,10 @@ class FileTool(Toolkit):
                                     results.append({"file": file_path, "line": i, "text": line.strip()})
                                     if len(results) >= max_results:
                                         return json.dumps(results)
-                    except Exception as e:
+                    except OSError as e:
                         results.append({"file": file_path, "error": str(e)})
                 else:
-                    results.append({"file": file_path, "size": os.path.getsize(file_path)})
+                    results.append({"file": file_path, "size": st.st_size})
                     if len(results) >= max_results:
                         return json.dumps(results)
         return json.dumps(results)
@@ -571,7 +719,6 @@ class FileTool(Toolkit):
         Returns:
             Success message with number of replacements
         """
-        import re
         path = safe_path(path)
 
         with open(path, "r", encoding='utf-8', errors="ignore") as f:
@@ -656,31 +803,22 @@ class TimeTool(Toolkit):
         """Get current time in various formats.
 
         Args:
-            format: Time format - iso, human, timestamp, date, time, or custom strftime
+            format: Time format - iso, human, timestamp (or unix), date, time, or custom strftime
 
         Returns:
             Formatted current time
         """
-        from datetime import datetime, timezone
-
-        now = datetime.now(timezone.utc)
-
-        if format == "iso":
-            return now.isoformat()
-        elif format == "human":
-            return now.strftime("%B %d, %Y %I:%M %p UTC")
-        elif format == "timestamp":
-            return str(int(now.timestamp()))
-        elif format == "date":
-            return now.strftime("%Y-%m-%d")
-        elif format == "time":
-            return now.strftime("%H:%M:%S")
-        else:
-            # Custom strftime format
-            try:
-                return now.strftime(format)
-            except:
-                return f"Invalid time format: {format}"
+        now = datetime.now(_UTC)
+
+        formatter = _TIME_FORMATTERS.get(format)
+        if formatter is not None:
+            return formatter(now)
+
+        # Custom strftime format
+        try:
+            return now.strftime(format)
+        except ValueError:
+            return f"Invalid time format: {format}"
 
 
 #====================================================================================================
@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 
 from pydantic import BaseModel, Field
 
-from .models import CommandExecution
+from .models import CommandExecution, ConfirmationRequest, ConfirmationResponse
 
 
 class EventType(str, Enum):
@@ -46,21 +46,6 @@ class ExecutionEvent(BaseModel):
         arbitrary_types_allowed = True
 
 
-class ConfirmationRequest(BaseModel):
-    """Request for user confirmation during execution."""
-
-    execution: CommandExecution
-    choices: list[str] = Field(default=["yes", "no", "modify", "explain"])
-    default_choice: str = "no"
-
-
-class ConfirmationResponse(BaseModel):
-    """User response to confirmation request."""
-
-    choice: str
-    modified_command: Optional[str] = None
-
-
 class StreamingExecutor(ABC):
     """Abstract base for streaming execution across frameworks."""
 
@@ -200,7 +200,8 @@ Any tool arguments(query, command, search, ...) should be supplied in the args p
                     if "result" in result_data:
                         result = result_data["result"]
                         if isinstance(result, (dict, list)):
-                            return json.dumps(result, indent=2)
+                            # Compact output: the agent doesn't need indentation, and indent= bypasses the C encoder
+                            return json.dumps(result, separators=(",", ":"))
                         else:
                             return str(result)
                     elif "error" in result_data:
@@ -1,22 +1,19 @@
 """Pydantic models and session tracking for da_code CLI tool."""
-from pathlib import Path
-env_file = Path('.env')
-if env_file.exists():
+import os
+if os.path.exists('.env'):
     from dotenv import load_dotenv
-    load_dotenv(env_file, override=False)
+    load_dotenv('.env', override=False)
 
 import asyncio
 import json
 import logging
-import os
 import uuid
 from datetime import datetime, timezone
 from enum import Enum
-from pathlib import Path
 from typing import Any, Annotated, Dict, List, Optional, Union
 
-import aiohttp
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import BulkWriteError
 
 
 from bson import ObjectId
@@ -315,7 +312,8 @@ class CodeSession(BaseModel):
     def add_llm_call(self, llm_call: LLMCall) -> None:
         """Add an LLM call to the session."""
         self.llm_calls.append(llm_call)
-        self.updated_at = datetime.now(timezone.utc)
+        # Reuse the call's own timestamp rather than reading the clock again
+        self.updated_at = llm_call.created_at
         self.total_llm_calls += 1
 
         if llm_call.total_tokens:
@@ -326,7 +324,7 @@ class CodeSession(BaseModel):
     def add_tool_call(self, tool_call: ToolCall) -> None:
         """Add a tool call to the session."""
         self.tool_calls.append(tool_call)
-        self.updated_at = datetime.now(timezone.utc)
+        self.updated_at = tool_call.created_at
         self.total_tool_calls += 1
 
     def get_session_summary(self) -> Dict[str, Any]:
@@ -385,10 +383,20 @@ class AgentConfig(BaseModel):
 class DaMongoTracker:
     """Async MongoDB tracker using Motor."""
 
+    # One long-lived client is shared by every save; keep a few sockets warm for batch flushes
+    MAX_POOL_SIZE = 50
+    MIN_POOL_SIZE = 5
+    WAIT_QUEUE_TIMEOUT_MS = 2000
+    # Prompts and responses are large, repetitive text; zlib ships with Python so needs no extra package
+    COMPRESSORS = "zlib"
+    ZLIB_COMPRESSION_LEVEL = 3
+
     def __init__(self):
         self.mongo_enabled = False
         self.client: Optional[AsyncIOMotorClient] = None
         self.database = "da_code"
+        self._collections: Dict[str, Any] = {}
+        self.dropped_writes = 0
         self._init_mongo_client()
 
     def _init_mongo_client(self) -> None:
@@ -396,31 +404,87 @@ class DaMongoTracker:
         self.mongo_enabled = False
         try:
             mongo_uri = os.getenv('MONGO_URI', None)
-            self.client = AsyncIOMotorClient(mongo_uri, serverSelectionTimeoutMS=3000)
+            if not mongo_uri:
+                # Don't let every save wait out the server selection timeout on localhost
+                logger.info("MongoDB not configured (MONGO_URI unset)")
+                return
+            self.client = AsyncIOMotorClient(
+                mongo_uri,
+                serverSelectionTimeoutMS=3000,
+                maxPoolSize=self.MAX_POOL_SIZE,
+                minPoolSize=self.MIN_POOL_SIZE,
+                waitQueueTimeoutMS=self.WAIT_QUEUE_TIMEOUT_MS,
+                compressors=self.COMPRESSORS,
+                zlibCompressionLevel=self.ZLIB_COMPRESSION_LEVEL,
+            )
             self.mongo_enabled = True
             logger.info(f"MongoDB client initialized: {mongo_uri}")
         except Exception as e:
             logger.info(f"MongoDB not available: {e}")
-            
+
+    @property
+    def connected(self) -> bool:
+        """Whether MongoDB writes should be attempted (cleared after the first failure)."""
+        return self.mongo_enabled and self.client is not None
+
+    def _collection(self, name: str):
+        """Return a cached collection handle on the shared client."""
+        coll = self._collections.get(name)
+        if coll is None:
+            coll = self._collections[name] = self.client[self.database][name]
+        return coll
 
     async def _save_to_mongo(self, collection: str, document: Dict[str, Any]) -> bool:
         """Save document directly to MongoDB."""
-        if not self.mongo_enabled or not self.client:
+        if not self.connected:
             return False
 
         try:
-            db = self.client[self.database]
-            coll = db[collection]
+            coll = self._collection(collection)
             await coll.insert_one(document)
             return True
         except Exception:
             self.mongo_enabled = False
             return False
 
+    async def _save_many_to_mongo(self, collection: str, documents: List[Dict[str, Any]]) -> bool:
+        """Save a batch of documents to MongoDB in one round-trip."""
+        if not self.connected:
+            return False
+
+        try:
+            coll = self._collection(collection)
+            # Unordered so the server can spread the batch and one bad document doesn't stop the rest
+            await coll.insert_many(documents, ordered=False)
+            return True
+        except BulkWriteError as e:
+            # The rest of the batch landed; count the rejects rather than re-saving everything
+            write_errors = e.details.get('writeErrors', [])
+            self.dropped_writes += len(write_errors)
+            logger.debug(f"Dropped {len(write_errors)} of {len(documents)} writes to {collection}")
+            return True
+        except Exception:
+            self.mongo_enabled = False
+            return False
+
+    async def _update_in_mongo(self, collection: str, query: Dict[str, Any],
+                               update: Dict[str, Any], upsert: bool = False) -> bool:
+        """Apply an update to a single MongoDB document."""
+        if not self.connected:
+            return False
+
+        try:
+            coll = self._collection(collection)
+            result = await coll.update_one(query, update, upsert=upsert)
+            return result.matched_count > 0 or result.upserted_id is not None
+        except Exception:
+            self.mongo_enabled = False
+            return False
+
     def _save_to_file(self, filename: str, data: Dict[str, Any]) -> None:
         """Fallback: save to local file."""
         try:
-            Path("da_sessions").mkdir(exist_ok=True)
+            os.makedirs("da_sessions", exist_ok=True)
             with open(f"da_sessions/{filename}", 'w') as f:
                 json.dump(data, f, indent=2, default=str)
         except Exception:
@@ -430,10 +494,58 @@ class DaMongoTracker:
         """Save session to MongoDB or file."""
         session_dict = session.dict()
 
-        success = await self._save_to_mongo("sessions", session_dict)
+        success = await self._update_in_mongo(
+            "sessions", {"session_id": session.session_id}, {"$set": session_dict}, upsert=True
+        )
         if not success:
             self._save_to_file(f"{session.session_id}.json", session_dict)
 
+    async def _push_session_docs(self, session: CodeSession, llm_docs: List[Dict[str, Any]],
+                                 tool_docs: List[Dict[str, Any]]) -> None:
+        """Append serialized calls to the stored session instead of rewriting the whole document."""
+        push: Dict[str, Any] = {}
+        if llm_docs:
+            push["llm_calls"] = {"$each": llm_docs}
+        if tool_docs:
+            push["tool_calls"] = {"$each": tool_docs}
+
+        update = {
+            "$push": push,
+            "$set": {
+                "updated_at": session.updated_at,
+                "total_llm_calls": session.total_llm_calls,
+                "total_tool_calls": session.total_tool_calls,
+                "total_tokens": session.total_tokens,
+                "estimated_cost": session.estimated_cost,
+            },
+        }
+
+        success = await self._update_in_mongo("sessions", {"session_id": session.session_id}, update)
+        if not success:
+            # Session not stored yet (or MongoDB is down) - fall back to a full save
+            await self.save_session(session)
+
+    async def save_calls(self, session: CodeSession, llm_calls: List[LLMCall],
+                         tool_calls: List[ToolCall]) -> None:
+        """Save a batch of calls to their collections and append them to the stored session.
+
+        Each call is serialized once; the collection inserts get shallow copies
+        carrying session_id (insert_many also adds _id to the documents it is given).
+        """
+        llm_docs = [llm_call.dict() for llm_call in llm_calls]
+        tool_docs = [tool_call.dict() for tool_call in tool_calls]
+        session_id = session.session_id
+
+        # The call collections and the session document are independent, so write them concurrently
+        writes = [self._push_session_docs(session, llm_docs, tool_docs)]
+        if llm_docs:
+            writes.append(self._insert_call_docs(
+                "llm_calls", "llm", [dict(doc, session_id=session_id) for doc in llm_docs]))
+        if tool_docs:
+            writes.append(self._insert_call_docs(
+                "tool_calls", "tool", [dict(doc, session_id=session_id) for doc in tool_docs]))
+        await asyncio.gather(*writes)
+
     async def save_llm_call(self, session_id: str, llm_call: LLMCall) -> None:
         """Save LLM call to MongoDB or file."""
         call_dict = llm_call.dict()
@@ -452,6 +564,14 @@ class DaMongoTracker:
         if not success:
             self._save_to_file(f"tool_{tool_call.id}.json", call_dict)
 
+    async def _insert_call_docs(self, collection: str, file_prefix: str,
+                                call_dicts: List[Dict[str, Any]]) -> None:
+        """Insert serialized calls into a collection, falling back to one file per call."""
+        success = await self._save_many_to_mongo(collection, call_dicts)
+        if not success:
+            for call_dict in call_dicts:
+                self._save_to_file(f"{file_prefix}_{call_dict['id']}.json", call_dict)
+
     async def close(self) -> None:
         """Close MongoDB connection."""
         if self.client:
@@ -522,6 +642,6 @@ da_mongo = DaMongoTracker()
 def get_mongo_status() -> bool:
     """Get current MongoDB connection status."""
     try:
-        return da_mongo.mongo_enabled and da_mongo.client is not None
+        return da_mongo.connected
     except:
         return False
\ No newline at end of file
@@ -1,24 +1,103 @@
 """Centralized telemetry tracking for all agent frameworks."""
 
+import asyncio
 import logging
+import os
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Mapping, Optional
 from datetime import datetime, timezone
+from types import MappingProxyType
 
 from .models import CodeSession, LLMCall, LLMCallStatus, ToolCall, ToolCallStatus, da_mongo
 
 logger = logging.getLogger(__name__)
 
 
+class AgentMetrics:
+    """Running totals and averages for agent calls."""
+
+    __slots__ = ("calls", "tokens", "total_time_us", "avg_tokens_per_call")
+
+    def __init__(self, calls: int = 0, tokens: int = 0, total_time_us: int = 0,
+                 avg_tokens_per_call: float = 0.0):
+        self.calls = calls
+        self.tokens = tokens
+        # Integer microseconds so the total never drifts; milliseconds are derived on read
+        self.total_time_us = total_time_us
+        self.avg_tokens_per_call = avg_tokens_per_call
+
+    @property
+    def total_time_ms(self) -> float:
+        return self.total_time_us / 1000
+
+    @property
+    def avg_time_ms(self) -> float:
+        return self.total_time_us / self.calls / 1000 if self.calls else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Metrics in the reporting shape (times in milliseconds)."""
+        return {
+            "calls": self.calls,
+            "tokens": self.tokens,
+            "total_time_ms": self.total_time_ms,
+            "avg_time_ms": self.avg_time_ms,
+            "avg_tokens_per_call": self.avg_tokens_per_call,
+        }
+
+
 class TelemetryManager:
     """Manages telemetry tracking across different agent frameworks."""
 
+    __slots__ = (
+        "session", "agent_metrics", "enabled", "max_buffered", "dropped_calls",
+        "_metrics_version", "_summary_key", "_summary_cache",
+        "_metrics_view_version", "_metrics_view", "_all_metrics_view",
+        "_pending_llm_calls", "_pending_tool_calls", "_session_dirty", "_closing",
+        "_flush_lock", "_wake", "_flusher",
+    )
+
+    # Queued calls are written once this many pile up, or every FLUSH_INTERVAL_S
+    FLUSH_BATCH_SIZE = 64
+    FLUSH_INTERVAL_S = 0.5
+
     def __init__(self, session: CodeSession):
         """Initialize telemetry manager."""
         self.session = session
-        self.agent_metrics: Dict[str, Any] = {
-            'calls': 0, 'tokens': 0, 'total_time_ms': 0
-        }
+        self.agent_metrics = AgentMetrics()
+
+        # With DA_TELEMETRY_ENABLED=0 only the agent metrics are kept; no records are built or saved
+        self.enabled = os.getenv("DA_TELEMETRY_ENABLED", "1").lower() not in ("0", "false", "no")
+
+        # Calls kept per session list; beyond this new calls are counted and dropped
+        self.max_buffered = int(os.getenv("DA_TELEMETRY_BUFFER_SIZE", "4096"))
+        self.dropped_calls = 0
+
+        # Summary memo, rebuilt only after metrics or the session change
+        self._metrics_version = 0
+        self._summary_key = None
+        self._summary_cache: Optional[Dict[str, Any]] = None
+        self._metrics_view_version = -1
+        self._metrics_view: Mapping[str, Any] = MappingProxyType({})
+        self._all_metrics_view: Mapping[str, Mapping[str, Any]] = MappingProxyType({})
+
+        # Pending MongoDB writes, drained by the background flusher
+        self._pending_llm_calls: List[LLMCall] = []
+        self._pending_tool_calls: List[ToolCall] = []
+        self._session_dirty = False
+        self._closing = False
+        # Created on first flush so it binds to the running loop (Python 3.9 locks bind at construction)
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def __aenter__(self):
+        """Use as ``async with TelemetryManager(session) as telemetry:`` to drain on exit."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Flush queued telemetry and save the session."""
+        await self.close()
+        return False
 
     async def track_agent_call(
         self,
@@ -31,6 +110,20 @@ class TelemetryManager:
     ) -> str:
         """Track an agent call with unified metrics."""
 
+        # Update agent metrics, keeping the token average running so summaries need no arithmetic
+        metrics = self.agent_metrics
+        self._metrics_version += 1
+        metrics.calls += 1
+        metrics.tokens += tokens_used
+        metrics.total_time_us += round(execution_time_ms * 1000)
+        metrics.avg_tokens_per_call += (tokens_used - metrics.avg_tokens_per_call) / metrics.calls
+
+        if not self.enabled:
+            return ""
+        if len(self.session.llm_calls) >= self.max_buffered:
+            self.dropped_calls += 1
+            return ""
+
         # Create LLM call record
         llm_call = LLMCall(
             model_name=self.session.agent_model,
@@ -43,22 +136,13 @@ class TelemetryManager:
             total_tokens=tokens_used
         )
 
-        # Add to session
+        # Add to session and queue for the background flusher
         self.session.add_llm_call(llm_call)
+        self._pending_llm_calls.append(llm_call)
+        self._schedule_flush()
 
-        # Update agent metrics
-        self.agent_metrics['calls'] += 1
-        self.agent_metrics['tokens'] += tokens_used
-        self.agent_metrics['total_time_ms'] += execution_time_ms
-
-        # Save to MongoDB asynchronously
-        try:
-            await da_mongo.save_session(self.session)
-            await da_mongo.save_llm_call(self.session.session_id, llm_call)
-        except Exception as e:
-            logger.debug(f"Failed to save telemetry to MongoDB: {e}")
-
-        logger.debug(f"Tracked agent call: {tokens_used} tokens, {execution_time_ms}ms")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Tracked agent call: {tokens_used} tokens, {execution_time_ms}ms")
         return llm_call.id
 
     async def track_tool_call(
@@ -73,6 +157,13 @@ class TelemetryManager:
     ) -> str:
         """Track a tool/MCP call."""
 
+        if not self.enabled:
+            return ""
+        self._metrics_version += 1
+        if len(self.session.tool_calls) >= self.max_buffered:
+            self.dropped_calls += 1
+            return ""
+
         # Create tool call record
         tool_call = ToolCall(
             server_name=server_name,
@@ -84,77 +175,189 @@ class TelemetryManager:
             error_message=error_message
         )
 
-        # Add to session
+        # Add to session and queue for the background flusher
         self.session.add_tool_call(tool_call)
+        self._pending_tool_calls.append(tool_call)
+        self._schedule_flush()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Tracked tool call: {server_name}.{tool_name}, {execution_time_ms}ms")
+        return tool_call.id
+
+    def _schedule_flush(self) -> None:
+        """Mark the session dirty and make sure the flusher is running."""
+        was_dirty = self._session_dirty
+        self._session_dirty = True
+
+        if self._flusher is None or self._flusher.done():
+            self._wake = asyncio.Event()
+            self._flusher = asyncio.create_task(self._flush_loop())
+        elif not was_dirty:
+            # The flusher is idle; move it on to its timed wait for this batch
+            self._wake.set()
+
+        if len(self._pending_llm_calls) + len(self._pending_tool_calls) >= self.FLUSH_BATCH_SIZE:
+            self._wake.set()
+
+    async def _flush_loop(self) -> None:
+        """Persist queued telemetry in batches until close() is called."""
+        while not self._closing:
+            if not self._session_dirty:
+                # Nothing queued: sleep until a call is tracked or close() is called
+                await self._wake.wait()
+                self._wake.clear()
+                continue
+
+            # Calls are waiting: write them once a batch fills up or FLUSH_INTERVAL_S passes
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.FLUSH_INTERVAL_S)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write all queued calls to MongoDB, appending them to the stored session."""
+        # Serialised so a caller's flush waits for a batch the flusher already has in flight
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            llm_calls, self._pending_llm_calls = self._pending_llm_calls, []
+            tool_calls, self._pending_tool_calls = self._pending_tool_calls, []
+            self._session_dirty = False
+
+            try:
+                if llm_calls or tool_calls:
+                    await da_mongo.save_calls(self.session, llm_calls, tool_calls)
+            except Exception as e:
+                logger.debug(f"Failed to save telemetry to MongoDB: {e}")
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Flushed telemetry: {len(llm_calls)} LLM calls, {len(tool_calls)} tool calls")
+
+    async def drain(self) -> None:
+        """Wait until every call tracked so far has been persisted.
+
+        Tracking never waits on MongoDB; call this before reading back stored
+        state (e.g. ahead of a session summary) so it is consistent.
+        """
+        await self.flush()
+
+    async def close(self) -> None:
+        """Stop the background flusher, write anything still queued and save the full session."""
+        if self._flusher is not None:
+            # Let the flusher finish its in-flight batch rather than cancelling mid-write
+            self._closing = True
+            self._wake.set()
+            await self._flusher
+            self._flusher = None
+            self._closing = False
+
+        await self.drain()
 
-        # Save to MongoDB asynchronously
         try:
             await da_mongo.save_session(self.session)
-            await da_mongo.save_tool_call(self.session.session_id, tool_call)
         except Exception as e:
-            logger.debug(f"Failed to save tool call to MongoDB: {e}")
+            logger.debug(f"Failed to save session to MongoDB: {e}")
 
-        logger.debug(f"Tracked tool call: {server_name}.{tool_name}, {execution_time_ms}ms")
-        return tool_call.id
+    def _refresh_metrics_views(self) -> None:
+        """Rebuild the read-only metrics views if metrics changed since the last read."""
+        if self._metrics_view_version != self._metrics_version:
+            self._metrics_view = MappingProxyType(self.agent_metrics.to_dict())
+            self._all_metrics_view = MappingProxyType({"langgraph": self._metrics_view})
+            self._metrics_view_version = self._metrics_version
 
-    def get_framework_metrics(self, framework: str) -> Dict[str, Any]:
-        """Get metrics for the agent (framework parameter kept for compatibility)."""
-        return self.agent_metrics
+    def get_framework_metrics(self, framework: str) -> Mapping[str, Any]:
+        """Get a read-only view of the agent metrics (framework parameter kept for compatibility)."""
+        self._refresh_metrics_views()
+        return self._metrics_view
 
-    def get_all_framework_metrics(self) -> Dict[str, Dict[str, Any]]:
-        """Get metrics for the agent (simplified from multi-framework)."""
-        return {"langgraph": self.agent_metrics}
+    def get_all_framework_metrics(self) -> Mapping[str, Mapping[str, Any]]:
+        """Get a read-only view of the agent metrics (simplified from multi-framework)."""
+        self._refresh_metrics_views()
+        return self._all_metrics_view
 
     def get_session_summary(self) -> Dict[str, Any]:
         """Get comprehensive session summary with agent metrics."""
-        summary = self.session.get_session_summary()
-        summary['framework_breakdown'] = self.get_all_framework_metrics()
-
-        # Calculate agent efficiency metrics
-        if self.agent_metrics['calls'] > 0:
-            avg_time = self.agent_metrics['total_time_ms'] / self.agent_metrics['calls']
-            avg_tokens = self.agent_metrics['tokens'] / self.agent_metrics['calls'] if self.agent_metrics['tokens'] > 0 else 0
-            summary['framework_breakdown']['langgraph'].update({
-                'avg_time_ms': avg_time,
-                'avg_tokens_per_call': avg_tokens
-            })
+        # Anything that adds to the session also moves updated_at
+        key = (self._metrics_version, self.session.updated_at)
+        if self._summary_cache is None or self._summary_key != key:
+            summary = self.session.get_session_summary()
+            summary['dropped_calls'] = self.dropped_calls
+            self._summary_cache, self._summary_key = summary, key
 
+        # The cached part is flat; the nested breakdown is built per call so callers can't
+        # mutate shared state (plain dicts keep the summary JSON-serializable)
+        summary = dict(self._summary_cache)
+        summary['framework_breakdown'] = {"langgraph": self.agent_metrics.to_dict()}
         return summary
 
     def reset_framework_metrics(self, framework: Optional[str] = None) -> None:
         """Reset agent metrics (framework parameter kept for compatibility)."""
-        self.agent_metrics = {'calls': 0, 'tokens': 0, 'total_time_ms': 0}
+        self.agent_metrics = AgentMetrics()
+        self._metrics_version += 1
         logger.debug(f"Reset agent metrics")
 
 
 class PerformanceTracker:
-    """Context manager for tracking execution performance."""
+    """Context manager for tracking execution performance.
+
+    Used with ``async with`` it also records the call with the telemetry manager:
+
+        async with PerformanceTracker(telemetry, "agno", "chat", prompt=task) as tracker:
+            tracker.response = await agent.arun(task)
+    """
 
-    def __init__(self, telemetry: TelemetryManager, framework: str, operation: str):
+    __slots__ = ("telemetry", "framework", "operation", "prompt", "start_ns", "duration_ns",
+                 "response", "tokens_used")
+
+    def __init__(self, telemetry: TelemetryManager, framework: str, operation: str,
+                 prompt: Optional[str] = None):
         """Initialize performance tracker."""
         self.telemetry = telemetry
         self.framework = framework
         self.operation = operation
-        self.start_time = None
-        self.end_time = None
+        self.prompt = prompt
+        self.start_ns: Optional[int] = None
+        self.duration_ns: Optional[int] = None
+
+        # Filled in by the caller inside an ``async with`` block
+        self.response: Optional[str] = None
+        self.tokens_used = 0
 
     def __enter__(self):
         """Start timing."""
-        self.start_time = time.time()
+        self.start_ns = time.perf_counter_ns()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """End timing and log performance."""
-        self.end_time = time.time()
-        duration_ms = (self.end_time - self.start_time) * 1000
+        self.duration_ns = time.perf_counter_ns() - self.start_ns
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{self.framework} {self.operation}: {self.get_duration_ms():.2f}ms, "
+                         f"success: {exc_type is None}")
 
-        success = exc_type is None
-        error_message = str(exc_val) if exc_val else None
+    async def __aenter__(self):
+        """Start timing."""
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """End timing and record the call with the telemetry manager."""
+        self.__exit__(exc_type, exc_val, exc_tb)
 
-        logger.debug(f"{self.framework} {self.operation}: {duration_ms:.2f}ms, success: {success}")
+        await self.telemetry.track_agent_call(
+            prompt=self.prompt if self.prompt is not None else self.operation,
+            response=self.response or "",
+            tokens_used=self.tokens_used,
+            execution_time_ms=self.get_duration_ms(),
+            success=exc_type is None,
+            error_message=str(exc_val) if exc_val else None
+        )
+        return False
 
     def get_duration_ms(self) -> float:
         """Get duration in milliseconds."""
-        if self.start_time and self.end_time:
-            return (self.end_time - self.start_time) * 1000
+        if self.duration_ns is not None:
+            return self.duration_ns / 1e6
         return 0.0
\ No newline at end of file
@@ -1,21 +1,44 @@
 import os
-import io
 import json
-import tempfile
-import shutil
-import builtins
 import subprocess
-import types
 import pytest
-from pathlib import Path
 
 from . import agno_tools as agno
 
 @pytest.fixture
-def temp_dir():
-    d = tempfile.mkdtemp()
-    yield d
-    shutil.rmtree(d)
+def temp_dir(tmp_path):
+    return str(tmp_path)
+
+@pytest.fixture
+def fake_run(monkeypatch):
+    """Patch subprocess.run to return a canned result; returns the list of (args, kwargs) seen."""
+    calls = []
+    def install(returncode=0, stdout=b'', stderr=b''):
+        def mock_run(*a, **k):
+            calls.append((a[0], k))
+            return subprocess.CompletedProcess(args=a[0], returncode=returncode, stdout=stdout, stderr=stderr)
+        monkeypatch.setattr(subprocess, 'run', mock_run)
+        return calls
+    return install
+
+class DummyResponse:
+    status_code = 200
+    reason_phrase = 'OK'
+    headers = {'content-type': 'text/plain'}
+    content = b'data'
+    text = 'hello'
+    def json(self):
+        return {'AbstractText': 'Summary', 'AbstractURL': 'url'}
+
+class DummyClient:
+    def __enter__(self): return self
+    def __exit__(self,a,b,c): pass
+    def get(self, url, headers=None): return DummyResponse()
+    def close(self): pass
+
+@pytest.fixture
+def dummy_httpx(monkeypatch):
+    monkeypatch.setattr(agno.httpx, 'Client', lambda **k: DummyClient())
 
 # ---------------- Utilities ----------------
 
@@ -23,9 +46,8 @@ def test_get_workspace_root_env(monkeypatch):
     monkeypatch.setenv('DA_CODE_WORKSPACE_ROOT', '/tmp/workspace')
     assert agno.get_workspace_root() == '/tmp/workspace'
 
-def test_safe_path_relative_inside(temp_dir):
-    monkeypatch_env = {'DA_CODE_WORKSPACE_ROOT': temp_dir}
-    os.environ.update(monkeypatch_env)
+def test_safe_path_relative_inside(temp_dir, monkeypatch):
+    monkeypatch.setenv('DA_CODE_WORKSPACE_ROOT', temp_dir)
     fpath = agno.safe_path('file.txt')
     assert fpath.startswith(temp_dir)
 
@@ -46,41 +68,123 @@ def test_todotool_check_exists(temp_dir):
     tool.create_todo('Task')
     assert '✅' in tool.check_exists()
 
+def test_todotool_skips_identical_write(temp_dir):
+    tool = agno.TodoTool(working_directory=temp_dir)
+    tool.create_todo('Same')
+    assert 'unchanged' in tool.create_todo('Same')
+    os.remove(os.path.join(temp_dir, 'todo.md'))
+    assert 'Created' in tool.create_todo('Same')
+
+def test_todotool_read_sees_external_edit(temp_dir):
+    tool = agno.TodoTool(working_directory=temp_dir)
+    tool.create_todo('First')
+    assert 'First' in tool.read_todo()
+    with open(os.path.join(temp_dir, 'todo.md'), 'w', encoding='utf-8') as f:
+        f.write('# TODO\n\nSecond edit\n')
+    assert 'Second edit' in tool.read_todo()
+
+def test_todotool_failed_write_leaves_no_tmp(temp_dir, monkeypatch):
+    tool = agno.TodoTool(working_directory=temp_dir)
+    def failing_write(fd, data):
+        raise OSError(28, 'No space left on device')
+    monkeypatch.setattr(agno.os, 'write', failing_write)
+    assert 'Error' in tool.create_todo('Task')
+    assert os.listdir(temp_dir) == []
+
+def test_todotool_keeps_symlink_and_mode(temp_dir):
+    real = os.path.join(temp_dir, 'real.md')
+    with open(real, 'w', encoding='utf-8') as f:
+        f.write('# TODO\n')
+    os.chmod(real, 0o600)
+    link = os.path.join(temp_dir, 'todo.md')
+    os.symlink(real, link)
+    tool = agno.TodoTool(working_directory=temp_dir)
+    tool.create_todo('Task')
+    assert os.path.islink(link)
+    assert os.stat(real).st_mode & 0o777 == 0o600
+    assert 'Task' in tool.read_todo()
+
 # ---------------- CommandTool ----------------
 
-def test_commandtool_success(monkeypatch):
+def test_commandtool_success(fake_run):
     tool = agno.CommandTool()
-    def mock_run(*a, **k):
-        return subprocess.CompletedProcess(args=a[0], returncode=0, stdout='ok', stderr='')
-    monkeypatch.setattr(subprocess, 'run', mock_run)
+    fake_run(stdout=b'ok')
     out = tool.execute_command('ls')
     assert '✅' in out
 
-def test_commandtool_fail(monkeypatch):
+def test_commandtool_fail(fake_run):
     tool = agno.CommandTool()
-    def mock_run(*a, **k):
-        return subprocess.CompletedProcess(args=a[0], returncode=1, stdout='', stderr='fail')
-    monkeypatch.setattr(subprocess, 'run', mock_run)
+    fake_run(returncode=1, stderr=b'fail')
     out = tool.execute_command('ls')
     assert '❌' in out
 
 # ---------------- WebSearchTool ----------------
 
-def test_websearchtool_success(monkeypatch):
+def test_websearchtool_success(dummy_httpx):
     tool = agno.WebSearchTool()
-    class DummyResponse:
-        status_code = 200
-        def json(self):
-            return {'AbstractText': 'Summary', 'AbstractURL': 'url'}
-    class DummyClient:
-        def __enter__(self): return self
-        def __exit__(self,a,b,c): pass
-        def get(self, url): return DummyResponse()
-    monkeypatch.setattr(agno.httpx, 'Client', lambda **k: DummyClient())
     out = tool.search('query')
     # Adjusted to match fallback output of current tool implementation
     assert ('Summary' in out) or ('No instant results available' in out)
 
+@pytest.fixture
+def websearch(monkeypatch):
+    """A fresh WebSearchTool on a recording client; yields (tool, clients made, URLs fetched, payload)."""
+    made, gets = [], []
+    payload = {'AbstractText': 'Summary', 'AbstractURL': 'url'}
+    class Response(DummyResponse):
+        def json(self):
+            return payload
+    class RecordingClient(DummyClient):
+        def get(self, url, headers=None):
+            gets.append(url)
+            return Response()
+    monkeypatch.setattr(agno.httpx, 'Client', lambda **k: made.append(k) or RecordingClient())
+    tool = agno.WebSearchTool()
+    yield tool, made, gets, payload
+    tool.close()
+    tool._results.clear()
+
+def test_websearchtool_reuses_client(websearch):
+    tool, made, _, _ = websearch
+    tool.search('one')
+    tool.search('two')
+    assert len(made) == 1
+    tool.close()
+    assert tool._client is None
+
+def test_websearchtool_caches_answers(websearch):
+    tool, _, gets, payload = websearch
+    payload['AbstractText'] = 'A detailed answer ' * 10
+    assert tool.search('query') == tool.search('query')
+    tool.search('query', num_results=3)
+    assert len(gets) == 2
+
+def test_websearchtool_does_not_cache_empty_results(websearch):
+    tool, _, gets, _ = websearch
+    assert 'No instant results available' in tool.search('query')
+    tool.search('query')
+    assert len(gets) == 2
+
+def test_websearchtool_cache_evicts_least_recently_used(websearch):
+    tool, _, gets, payload = websearch
+    payload['AbstractText'] = 'A detailed answer ' * 10
+    tool.CACHE_SIZE = 2
+    tool.search('a')
+    tool.search('b')
+    tool.search('a')
+    tool.search('c')
+    assert [key[0] for key in tool._results] == ['a', 'c']
+    assert len(gets) == 3
+
+def test_websearchtool_drops_expired_entries(websearch):
+    tool, _, gets, payload = websearch
+    payload['AbstractText'] = 'A detailed answer ' * 10
+    tool.search('query')
+    tool.CACHE_TTL_S = 0
+    payload.clear()
+    tool.search('query')
+    assert len(gets) == 2 and not tool._results
+
 # ---------------- FileTool ----------------
 
 def test_filetool_create_and_list(temp_dir):
@@ -107,6 +211,18 @@ def test_filetool_replace(temp_dir):
     msg = tool.replace_text(fpath, 'abc', 'xyz')
     assert 'Replaced' in msg
 
+def test_filetool_search_files_limit(temp_dir, monkeypatch):
+    monkeypatch.setenv('DA_CODE_WORKSPACE_ROOT', temp_dir)
+    os.mkdir(os.path.join(temp_dir, 'sub'))
+    for name in ('a.txt', 'b.txt', 'sub/c.txt'):
+        with open(os.path.join(temp_dir, name), 'w') as f:
+            f.write('needle\n')
+    tool = agno.FileTool()
+    found = json.loads(tool.search_files('**/*', max_results=2))
+    assert len(found) == 2 and all(r['size'] == 7 for r in found)
+    hits = json.loads(tool.search_files('**/*.txt', content='needle'))
+    assert len(hits) == 3
+
 # ---------------- TimeTool ----------------
 
 def test_timetool_formats():
@@ -128,177 +244,68 @@ def test_pythontool_error():
 
 # ---------------- GitTool ----------------
 
-def test_gittool_status(monkeypatch):
+def test_gittool_status(fake_run):
     t = agno.GitTool()
-    monkeypatch.setattr(subprocess, 'run', lambda *a, **k: subprocess.CompletedProcess(a[0], 0, 'dirty', ''))
+    fake_run(stdout='dirty', stderr='')
     assert '📋' in t.status()
 
 # ---------------- HttpTool ----------------
 
-def test_httptool_fetch(monkeypatch):
+def test_httptool_fetch(dummy_httpx):
     t = agno.HttpTool()
-    class DummyResponse:
-        status_code = 200
-        reason_phrase = 'OK'
-        headers = {'content-type': 'text/plain'}
-        content = b'data'
-        text = 'hello'
-    class DummyClient:
-        def __enter__(self): return self
-        def __exit__(self,a,b,c): pass
-        def get(self, url, headers): return DummyResponse()
-    monkeypatch.setattr(agno.httpx, 'Client', lambda **k: DummyClient())
     out = t.fetch('http://test')
     assert 'HTTP GET' in out
-import os
-import io
-import json
-import tempfile
-import shutil
-import builtins
-import subprocess
-import types
-import pytest
-from pathlib import Path
-
-from . import agno_tools as agno
-
-@pytest.fixture
-def temp_dir():
-    d = tempfile.mkdtemp()
-    yield d
-    shutil.rmtree(d)
 
-# ---------------- Utilities ----------------
 
-def test_get_workspace_root_env(monkeypatch):
-    monkeypatch.setenv('DA_CODE_WORKSPACE_ROOT', '/tmp/workspace')
-    assert agno.get_workspace_root() == '/tmp/workspace'
+# ---------------- CommandTool (exec path) ----------------
 
-def test_safe_path_relative_inside(temp_dir):
-    monkeypatch_env = {'DA_CODE_WORKSPACE_ROOT': temp_dir}
-    os.environ.update(monkeypatch_env)
-    fpath = agno.safe_path('file.txt')
-    assert fpath.startswith(temp_dir)
 
-def test_get_file_emoji_py():
-    assert agno.get_file_emoji('test.py') == "🐍"
-
-# ---------------- TodoTool ----------------
-
-def test_todotool_create_and_read(temp_dir):
-    tool = agno.TodoTool(working_directory=temp_dir)
-    msg = tool.create_todo('My Task')
-    assert 'todo.md' in msg
-    assert 'TODO' in tool.read_todo()
-
-def test_todotool_check_exists(temp_dir):
-    tool = agno.TodoTool(working_directory=temp_dir)
-    assert '❌' in tool.check_exists()
-    tool.create_todo('Task')
-    assert '✅' in tool.check_exists()
-
-# ---------------- CommandTool ----------------
-
-def test_commandtool_success(monkeypatch):
+def test_commandtool_plain_command_skips_shell(fake_run):
     tool = agno.CommandTool()
+    calls = fake_run(stdout=b'ok')
+    tool.execute_command('ls -la')
+    tool.execute_command('ls | wc -l')
+    tool.execute_command('ls # note')
+    tool.execute_command('cd sub')
+    tool.execute_command('FOO=1 env')
+    tool.execute_command('! grep x f')
+    tool.execute_command('true')
+    tool.execute_command('readonly X')
+    tool.execute_command('if test -f x')
+    assert [(args, k.get('shell', False)) for args, k in calls] == [
+        (['ls', '-la'], False), ('ls | wc -l', True), ('ls # note', True),
+        ('cd sub', True), ('FOO=1 env', True), ('! grep x f', True),
+        ('true', True), ('readonly X', True), ('if test -f x', True),
+    ]
+
+
+def test_commandtool_script_without_shebang_runs_in_shell(temp_dir):
+    script = os.path.join(temp_dir, 'hello')
+    with open(script, 'w') as f:
+        f.write('echo from-sh\n')
+    os.chmod(script, 0o755)
+    out = agno.CommandTool().execute_command('./hello', working_directory=temp_dir)
+    assert 'from-sh' in out
+
+
+def test_commandtool_missing_program_not_retried(monkeypatch):
+    calls = []
     def mock_run(*a, **k):
-        return subprocess.CompletedProcess(args=a[0], returncode=0, stdout='ok', stderr='')
+        calls.append(a[0])
+        raise FileNotFoundError(2, 'No such file or directory', a[0][0])
     monkeypatch.setattr(subprocess, 'run', mock_run)
-    out = tool.execute_command('ls')
-    assert '✅' in out
+    out = agno.CommandTool().execute_command('no-such-program --flag')
+    assert 'not found' in out and calls == [['no-such-program', '--flag']]
 
-def test_commandtool_fail(monkeypatch):
-    tool = agno.CommandTool()
-    def mock_run(*a, **k):
-        return subprocess.CompletedProcess(args=a[0], returncode=1, stdout='', stderr='fail')
-    monkeypatch.setattr(subprocess, 'run', mock_run)
-    out = tool.execute_command('ls')
-    assert '❌' in out
 
-# ---------------- WebSearchTool ----------------
-
-def test_websearchtool_success(monkeypatch):
-    tool = agno.WebSearchTool()
-    class DummyResponse:
-        status_code = 200
-        def json(self):
-            return {'AbstractText': 'Summary', 'AbstractURL': 'url'}
-    class DummyClient:
-        def __enter__(self): return self
-        def __exit__(self,a,b,c): pass
-        def get(self, url): return DummyResponse()
-    monkeypatch.setattr(agno.httpx, 'Client', lambda **k: DummyClient())
-    out = tool.search('query')
-    # Adjusted to match fallback output of current tool implementation
-    assert ('Summary' in out) or ('No instant results available' in out)
-
-# ---------------- FileTool ----------------
-
-def test_filetool_create_and_list(temp_dir):
-    tool = agno.FileTool()
-    fpath = os.path.join(temp_dir, 'a.txt')
-    tool.create_file(fpath, 'data')
-    listing = tool.list_directory(temp_dir)
-    try:
-        listing_obj = json.loads(listing)
-        assert listing_obj['path'] == temp_dir
-    except json.JSONDecodeError:
-        assert temp_dir in listing
-
-def test_filetool_read_write(temp_dir):
-    tool = agno.FileTool()
-    fpath = os.path.join(temp_dir, 'b.txt')
-    tool.write_file(fpath, 'hello')
-    assert 'hello' in tool.read_file(fpath)
-
-def test_filetool_replace(temp_dir):
-    tool = agno.FileTool()
-    fpath = os.path.join(temp_dir, 'c.txt')
-    tool.write_file(fpath, 'abc abc')
-    msg = tool.replace_text(fpath, 'abc', 'xyz')
-    assert 'Replaced' in msg
-
-# ---------------- TimeTool ----------------
-
-def test_timetool_formats():
-    t = agno.TimeTool()
-    assert 'T' in t.current_time('iso')
-    assert 'UTC' in t.current_time('human')
-
-# ---------------- PythonTool ----------------
-
-def test_pythontool_success():
-    t = agno.PythonTool()
-    res = t.execute_code("print('hi')")
-    assert 'hi' in res
-
-def test_pythontool_error():
-    t = agno.PythonTool()
-    res = t.execute_code("raise ValueError('x')")
-    assert '❌' in res
-
-# ---------------- GitTool ----------------
-
-def test_gittool_status(monkeypatch):
-    t = agno.GitTool()
-    monkeypatch.setattr(subprocess, 'run', lambda *a, **k: subprocess.CompletedProcess(a[0], 0, 'dirty', ''))
-    assert '📋' in t.status()
+def test_commandtool_missing_working_directory(temp_dir):
+    tool = agno.CommandTool()
+    out = tool.execute_command('ls', working_directory=os.path.join(temp_dir, 'missing'))
+    assert 'does not exist' in out
 
-# ---------------- HttpTool ----------------
 
-def test_httptool_fetch(monkeypatch):
-    t = agno.HttpTool()
-    class DummyResponse:
-        status_code = 200
-        reason_phrase = 'OK'
-        headers = {'content-type': 'text/plain'}
-        content = b'data'
-        text = 'hello'
-    class DummyClient:
-        def __enter__(self): return self
-        def __exit__(self,a,b,c): pass
-        def get(self, url, headers): return DummyResponse()
-    monkeypatch.setattr(agno.httpx, 'Client', lambda **k: DummyClient())
-    out = t.fetch('http://test')
-    assert 'HTTP GET' in out
\ No newline at end of file
+def test_commandtool_truncates_long_output(fake_run):
+    tool = agno.CommandTool()
+    fake_run(stdout=b'x' * 50000)
+    out = tool.execute_command('ls')
+    assert out.endswith('x' * 2000 + '...\n(truncated)')
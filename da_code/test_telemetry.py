@@ -0,0 +1,151 @@
+import asyncio
+import os
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+from . import models
+from . import telemetry
+
+
+class FakeUpdateResult:
+    matched_count = 1
+    upserted_id = None
+
+
+class FakeCollection:
+    """Records the writes a DaMongoTracker sends instead of talking to MongoDB."""
+    def __init__(self, name, log, insert_error=None):
+        self.name = name
+        self.log = log
+        self.insert_error = insert_error
+
+    async def insert_many(self, documents, ordered=True):
+        self.log.append(('insert_many', self.name, len(documents), ordered))
+        if self.insert_error is not None:
+            raise self.insert_error
+
+    async def update_one(self, query, update, upsert=False):
+        self.log.append(('update_one', self.name, query, update))
+        return FakeUpdateResult()
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    """A DaMongoTracker whose collections are fakes; returns (tracker, write log)."""
+    monkeypatch.delenv('MONGO_URI', raising=False)
+    tracker = models.DaMongoTracker()
+    log = []
+    tracker.client = object()
+    tracker.mongo_enabled = True
+    tracker._collections = {name: FakeCollection(name, log) for name in ('sessions', 'llm_calls', 'tool_calls')}
+    return tracker, log
+
+
+def make_calls(n_llm, n_tool):
+    llm_calls = [models.LLMCall(model_name='gpt-4', prompt=f'p{i}') for i in range(n_llm)]
+    tool_calls = [models.ToolCall(server_name='s', tool_name=f't{i}') for i in range(n_tool)]
+    return llm_calls, tool_calls
+
+
+def test_save_calls_batches_inserts_and_pushes_once(tracker):
+    tracker, log = tracker
+    session = models.CodeSession(working_directory='.')
+    llm_calls, tool_calls = make_calls(3, 2)
+    asyncio.run(tracker.save_calls(session, llm_calls, tool_calls))
+
+    inserts = sorted(entry[1:] for entry in log if entry[0] == 'insert_many')
+    assert inserts == [('llm_calls', 3, False), ('tool_calls', 2, False)]
+
+    updates = [entry for entry in log if entry[0] == 'update_one']
+    assert len(updates) == 1
+    _, collection, query, update = updates[0]
+    assert collection == 'sessions' and query == {'session_id': session.session_id}
+    assert [doc['id'] for doc in update['$push']['llm_calls']['$each']] == [c.id for c in llm_calls]
+    assert [doc['id'] for doc in update['$push']['tool_calls']['$each']] == [c.id for c in tool_calls]
+
+
+def test_push_session_docs_skips_empty_lists(tracker):
+    tracker, log = tracker
+    session = models.CodeSession(working_directory='.')
+    llm_calls, _ = make_calls(2, 0)
+    asyncio.run(tracker._push_session_docs(session, [c.dict() for c in llm_calls], []))
+    (_, _, _, update), = log
+    assert list(update['$push']) == ['llm_calls']
+
+
+def test_bulk_write_errors_are_counted_not_refiled(tracker, tmp_path, monkeypatch):
+    tracker, log = tracker
+    monkeypatch.chdir(tmp_path)
+    error = BulkWriteError({'writeErrors': [{'index': 0}, {'index': 2}], 'nInserted': 1})
+    tracker._collections['llm_calls'] = FakeCollection('llm_calls', log, insert_error=error)
+    docs = [{'id': str(i)} for i in range(3)]
+    assert asyncio.run(tracker._save_many_to_mongo('llm_calls', docs)) is True
+    assert tracker.dropped_writes == 2 and tracker.connected
+    assert not os.path.exists('da_sessions')
+
+
+def test_save_calls_falls_back_to_files(tmp_path, monkeypatch):
+    monkeypatch.delenv('MONGO_URI', raising=False)
+    monkeypatch.chdir(tmp_path)
+    tracker = models.DaMongoTracker()
+    session = models.CodeSession(working_directory='.')
+    llm_calls, tool_calls = make_calls(2, 1)
+    asyncio.run(tracker.save_calls(session, llm_calls, tool_calls))
+    expected = {f'llm_{c.id}.json' for c in llm_calls} | {f'tool_{c.id}.json' for c in tool_calls}
+    expected.add(f'{session.session_id}.json')
+    assert set(os.listdir('da_sessions')) == expected
+
+
+def test_telemetry_close_flushes_queued_calls_in_one_batch(tracker, monkeypatch):
+    tracker, log = tracker
+    monkeypatch.setattr(telemetry, 'da_mongo', tracker)
+    session = models.CodeSession(working_directory='.')
+
+    async def run():
+        async with telemetry.TelemetryManager(session) as manager:
+            for i in range(5):
+                await manager.track_agent_call(f'p{i}', 'r', tokens_used=2)
+            await manager.track_tool_call('s', 't', {})
+
+    asyncio.run(run())
+    assert sorted(entry[1:] for entry in log if entry[0] == 'insert_many') == [
+        ('llm_calls', 5, False), ('tool_calls', 1, False)]
+    # One $push for the batch, then the full session save on close
+    assert [entry[0] for entry in log if entry[1] == 'sessions'] == ['update_one', 'update_one']
+
+
+def test_flusher_sleeps_while_queue_is_empty(tracker, monkeypatch):
+    tracker, log = tracker
+    monkeypatch.setattr(telemetry, 'da_mongo', tracker)
+    monkeypatch.setattr(telemetry.TelemetryManager, 'FLUSH_INTERVAL_S', 0.01)
+    timed_waits = []
+    real_wait_for = asyncio.wait_for
+    def counting_wait_for(aw, timeout):
+        timed_waits.append(timeout)
+        return real_wait_for(aw, timeout)
+    monkeypatch.setattr(telemetry.asyncio, 'wait_for', counting_wait_for)
+
+    async def run():
+        manager = telemetry.TelemetryManager(models.CodeSession(working_directory='.'))
+        await manager.track_agent_call('p', 'r')
+        await asyncio.sleep(0.05)
+        flushed = [entry for entry in log if entry[0] == 'insert_many']
+        waits = len(timed_waits)
+        await asyncio.sleep(0.05)
+        idle_waits = len(timed_waits) - waits
+        await manager.close()
+        return flushed, idle_waits
+
+    flushed, idle_waits = asyncio.run(run())
+    assert flushed == [('insert_many', 'llm_calls', 1, False)]
+    assert idle_waits == 0
+
+
+def test_session_summary_breakdown_is_not_shared():
+    manager = telemetry.TelemetryManager(models.CodeSession(working_directory='.'))
+    first = manager.get_session_summary()
+    first['framework_breakdown']['langgraph']['calls'] = 99
+    first['framework_breakdown']['extra'] = {}
+    second = manager.get_session_summary()
+    assert second['framework_breakdown'] == {'langgraph': manager.agent_metrics.to_dict()}
@@ -5,7 +5,8 @@ import time
 import asyncio
 import random
 import sys
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from da_code.models import ConfirmationResponse, UserResponse, CommandExecution
 from rich.console import Console
@@ -17,6 +18,24 @@ from rich.status import Status
 # Global console for clean interaction
 console = Console()
 
+# Keypress shortcuts for the confirmation prompt
+_NUMBER_KEYS = {'1': 0, '2': 1, '3': 2, '4': 3}
+_ENTER_KEYS = frozenset(('\r', '\n'))
+
+# Return to column 0 and clear the line, for redrawing the selection indicator
+_CLEAR_LINE = '\r\033[K'
+
+# Normalized confirmation answers; anything unrecognized falls back to "no"
+_RESPONSE_MAP = {response.value: response.value for response in UserResponse}
+
+# Choice configuration with colors for the confirmation prompt
+_CHOICE_CONFIG = {
+    "yes": {"label": "✅ Yes", "desc": "Execute the command as shown", "color": "green"},
+    "no": {"label": "❌ No", "desc": "Cancel command execution", "color": "red"},
+    "modify": {"label": "✏️  Modify", "desc": "Edit the command before execution", "color": "yellow"},
+    "explain": {"label": "❓ Explain", "desc": "Ask agent to explain the command", "color": "blue"}
+}
+
 #====================================================================================================
 # Status Interface Class
 #====================================================================================================
@@ -37,7 +56,7 @@ class SimpleStatusInterface:
 
     def start_execution(self, message: str):
         """Start execution with status message."""
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         self.llm_calls = 0
         self.tool_calls = 0
         self.total_tokens = 0
@@ -49,7 +68,7 @@ class SimpleStatusInterface:
     def update_status(self, message: str):
         """Update the current status message."""
         if self.current_status:
-            elapsed = time.time() - self.start_time if self.start_time else 0
+            elapsed = time.perf_counter() - self.start_time if self.start_time else 0
             status_text = f"🤖 {message} | {elapsed:.1f}s"
             if self.llm_calls > 0:
                 status_text += f" | LLM: {self.llm_calls}"
@@ -81,7 +100,7 @@ class SimpleStatusInterface:
         if self.current_status:
             self.current_status.stop()
 
-        elapsed = time.time() - self.start_time if self.start_time else 0
+        elapsed = time.perf_counter() - self.start_time if self.start_time else 0
 
         if success:
             result_text = "✅ Complete"
@@ -117,14 +136,6 @@ class SimpleStatusInterface:
 async def async_prompt_user_silent(choices: List[str], default: str = None, command: str = None) -> str:
     """Interactive prompt with visual arrow indicator for selected option."""
 
-    # Choice configuration with colors
-    choice_config = {
-        "yes": {"label": "✅ Yes", "desc": "Execute the command as shown", "color": "green"},
-        "no": {"label": "❌ No", "desc": "Cancel command execution", "color": "red"},
-        "modify": {"label": "✏️  Modify", "desc": "Edit the command before execution", "color": "yellow"},
-        "explain": {"label": "❓ Explain", "desc": "Ask agent to explain the command", "color": "blue"}
-    }
-
     def display_static_confirmation():
         """Display confirmation panel once - no updates until selection made."""
         content_lines = Text()
@@ -139,7 +150,7 @@ async def async_prompt_user_silent(choices: List[str], default: str = None, comm
 
         # Add choices (no arrow initially)
         for i, choice in enumerate(choices):
-            config = choice_config.get(choice.lower(), {"label": choice, "desc": "", "color": "white"})
+            config = _CHOICE_CONFIG.get(choice.lower(), {"label": choice, "desc": "", "color": "white"})
             line = Text()
             line.append("    ", style="white")
             line.append(f"{i+1}. {config['label']}", style=config['color'])
@@ -171,20 +182,29 @@ async def async_prompt_user_silent(choices: List[str], default: str = None, comm
         fd = sys.stdin.fileno()
         selected_index = 0  # Initialize locally
 
+        # Indicator line per choice, built once so a keypress is a single write + flush
+        indicators = [
+            f"{_CLEAR_LINE}▶ {i + 1}. {_CHOICE_CONFIG.get(choice.lower(), {'label': choice})['label']}"
+            for i, choice in enumerate(choices)
+        ]
+
+        def show_indicator():
+            sys.stdout.write(indicators[selected_index])
+            sys.stdout.flush()
+
         try:
             # Display confirmation panel once
             display_static_confirmation()
 
             # display the default choice
-            config = choice_config.get(choices[selected_index].lower(), {"label": choices[selected_index], "desc": "", "color": "white"})
-            print(f"\r\033[K▶ {selected_index + 1}. {config['label']}", end='', flush=True)
+            show_indicator()
 
             while True:
                 key = sys.stdin.read(1)
 
                 # Number key shortcuts
-                if key in ['1', '2', '3', '4']:
-                    idx = int(key) - 1
+                if key in _NUMBER_KEYS:
+                    idx = _NUMBER_KEYS[key]
                     if idx < len(choices):
                         return choices[idx]
 
@@ -193,16 +213,15 @@ async def async_prompt_user_silent(choices: List[str], default: str = None, comm
                     key += sys.stdin.read(2)
                     if key == '\x1b[A':  # Up
                         selected_index = (selected_index - 1) % len(choices)
-                        config = choice_config.get(choices[selected_index].lower(), {"label": choices[selected_index], "color": "white"})
-                        print(f"\r\033[K▶ {selected_index + 1}. {config['label']}", end='', flush=True)
+                        show_indicator()
                     elif key == '\x1b[B':  # Down
                         selected_index = (selected_index + 1) % len(choices)
-                        config = choice_config.get(choices[selected_index].lower(), {"label": choices[selected_index], "color": "white"})
-                        print(f"\r\033[K▶ {selected_index + 1}. {config['label']}", end='', flush=True)
+                        show_indicator()
 
                 # Enter key
-                elif key in ['\r', '\n']:
-                    print('\r\033[K', end='', flush=True)
+                elif key in _ENTER_KEYS:
+                    sys.stdout.write(_CLEAR_LINE)
+                    sys.stdout.flush()
                     return choices[selected_index]
 
                 # Ctrl+C
@@ -213,11 +232,11 @@ async def async_prompt_user_silent(choices: List[str], default: str = None, comm
             pass
 
     # Get choice asynchronously
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     selected_choice = await loop.run_in_executor(None, get_keypress_choice)
 
     # Show clean selection result in console history
-    config = choice_config.get(selected_choice.lower(), {"label": selected_choice, "color": "white"})
+    config = _CHOICE_CONFIG.get(selected_choice.lower(), {"label": selected_choice, "color": "white"})
     console.print(f"[green bold]✅ Selected: {config['label']}[/green bold]")
 
     return selected_choice
@@ -276,7 +295,7 @@ def display_simple_confirmation(execution) -> None:
 
 async def async_prompt_text(message: str, default: str = None) -> str:
     """Async wrapper for Rich text prompts."""
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     return await loop.run_in_executor(
         None,
         lambda: Prompt.ask(message, default=default)
@@ -307,17 +326,7 @@ async def confirmation_handler(execution: CommandExecution, status_interface: Si
     status_interface.start_execution("Processing...")
 
     # Convert response back to enum value for consistency
-    response_lower = response.lower()
-    if response_lower == "yes":
-        enum_choice = UserResponse.YES.value
-    elif response_lower == "no":
-        enum_choice = UserResponse.NO.value
-    elif response_lower == "modify":
-        enum_choice = UserResponse.MODIFY.value
-    elif response_lower == "explain":
-        enum_choice = UserResponse.EXPLAIN.value
-    else:
-        enum_choice = UserResponse.NO.value  # Default fallback
+    enum_choice = _RESPONSE_MAP.get(response.lower(), UserResponse.NO.value)
 
     return ConfirmationResponse(
         choice=enum_choice,
@@ -330,9 +339,7 @@ async def confirmation_handler(execution: CommandExecution, status_interface: Si
 #====================================================================================================
 
 
-def get_splash_screen() -> str:
-    """Get the da_code ASCII splash screen."""
-    ascii_art = r"""
+_SPLASH_TEMPLATE = r"""
 ██████╗  █████╗      ██████╗ ██████╗ ██████╗ ███████╗
 ██╔══██╗██╔══██╗    ██╔════╝██╔═══██╗██╔══██╗██╔════╝
 ██║  ██║███████║    ██║     ██║   ██║██║  ██║█████╗
@@ -340,28 +347,23 @@ def get_splash_screen() -> str:
 ██████╔╝██║  ██║    ╚██████╗╚██████╔╝██████╔╝███████╗
 ╚═════╝ ╚═╝  ╚═╝     ╚═════╝ ╚═════╝ ╚═════╝ ╚══════╝
 
-    🤖 Agentic CLI with Agno & Azure OpenAI 🚀
+    {tagline}
     """
-    return ascii_art
 
+_TAGLINES = (
+    "🤖 Agentic CLI with Agno & Azure OpenAI 🚀",
+    "🧠 AI-Powered Command Line Assistant 🔧",
+    "⚡ Smart Automation with Human Oversight 🛡️",
+    "🎯 Precision Coding with AI Intelligence 💡",
+    "🔬 Advanced AI Tooling for Developers 🚀",
+    "🌟 Next-Gen CLI Experience 🤖",
+    "⚙️  Intelligent Command Execution 🎪",
+    "🎨 Where AI Meets Development Workflow 🔥"
+)
 
-def get_random_taglines() -> List[str]:
-    """Get random taglines for variety."""
-    return [
-        "🤖 Agentic CLI with Agno & Azure OpenAI 🚀",
-        "🧠 AI-Powered Command Line Assistant 🔧",
-        "⚡ Smart Automation with Human Oversight 🛡️",
-        "🎯 Precision Coding with AI Intelligence 💡",
-        "🔬 Advanced AI Tooling for Developers 🚀",
-        "🌟 Next-Gen CLI Experience 🤖",
-        "⚙️  Intelligent Command Execution 🎪",
-        "🎨 Where AI Meets Development Workflow 🔥"
-    ]
-
+_SPLASH = _SPLASH_TEMPLATE.format(tagline=_TAGLINES[0])
 
-def get_mini_splash() -> str:
-    """Get a smaller splash for quick starts."""
-    return r"""
+_MINI_SPLASH = r"""
 ██████╗  █████╗ ██████╗
 ██╔══██╗██╔══██╗██╔════╝
 ██║  ██║███████║██║
@@ -371,10 +373,7 @@ def get_mini_splash() -> str:
 🤖 Your AI Coding Assistant 🚀
 """
 
-
-def get_status_splash() -> str:
-    """Get splash screen for status/setup commands."""
-    return r"""
+_STATUS_SPLASH = r"""
     ╔═════════════════════════════════╗
     ║     ██████╗  █████╗ ██████╗     ║
     ║     ██╔══██╗██╔══██╗██╔════╝    ║
@@ -386,470 +385,78 @@ def get_status_splash() -> str:
     """
 
 
-def print_with_colors(text: str, color_code: str = "94") -> None:
-    """Print text with ANSI colors."""
-    print(f"\033[{color_code}m{text}\033[0m")
-
-
-def print_gradient_splash(text: str) -> None:
-    """Print splash with gradient effect."""
-    lines = text.split('\n')
-    # True blue gradient: dark blue -> bright blue -> cyan
-    colors = ["34", "94", "94", "96", "96", "36", "36", "96"]
-
-    for i, line in enumerate(lines):
-        color = colors[i % len(colors)]
-        print(f"\033[{color}m{line}\033[0m")
-
-
-def print_rainbow_splash(text: str) -> None:
-    """Print splash with rainbow colors."""
-    lines = text.split('\n')
-    rainbow_colors = ["91", "93", "92", "96", "94", "95"]
-
-    for i, line in enumerate(lines):
-        if line.strip():  # Only color non-empty lines
-            color = rainbow_colors[i % len(rainbow_colors)]
-            print(f"\033[{color}m{line}\033[0m")
-        else:
-            print(line)
-
-
-def show_splash(style: str = "default", mini: bool = False) -> None:
-    """Show splash screen with specified style."""
-    if mini:
-        splash = get_mini_splash()
-    else:
-        splash = get_splash_screen()
-        # Add random tagline
-        taglines = get_random_taglines()
-        random_tagline = random.choice(taglines)
-        splash = splash.replace("🤖 Agentic CLI with Agno & Azure OpenAI 🚀", random_tagline)
-
-    # Apply styling
-    if style == "gradient":
-        print_gradient_splash(splash)
-    elif style == "blue":
-        print_with_colors(splash, "94")
-    elif style == "cyan":
-        print_with_colors(splash, "96")
-    elif style == "green":
-        print_with_colors(splash, "92")
-    elif style == "yellow":
-        print_with_colors(splash, "93")
-    elif style == "purple":
-        print_with_colors(splash, "95")
-    else:
-        # Default - no colors
-        print(splash)
-
-
-def show_status_splash() -> None:
-    """Show splash for status/configuration commands."""
-    print_with_colors(get_status_splash(), "96")
-
-"""User experience module - UI prompts and splash screens for da_code CLI."""
-
-import os
-import time
-import asyncio
-import random
-import sys
-from typing import List, Optional
-
-from da_code.models import ConfirmationResponse, UserResponse, CommandExecution
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt
-from rich.text import Text
-from rich.status import Status
-
-# Global console for clean interaction
-console = Console()
-
-#====================================================================================================
-# Status Interface Class
-#====================================================================================================
-
-
-class SimpleStatusInterface:
-    """Simple status interface with Rich spinner and agent insights."""
-
-    def __init__(self):
-        self.start_time = None
-        self.current_status = None
-        self.llm_calls = 0
-        self.tool_calls = 0
-        self.total_tokens = 0
-        self.callback_handler = None
-        # Agent metrics (LangGraph only)
-        self.agent_metrics = {'calls': 0, 'tokens': 0}
-
-    def start_execution(self, message: str):
-        """Start execution with status message."""
-        self.start_time = time.time()
-        self.llm_calls = 0
-        self.tool_calls = 0
-        self.total_tokens = 0
-        # Reset agent metrics
-        self.agent_metrics = {'calls': 0, 'tokens': 0}
-        self.current_status = Status(f"🤖 {message}", spinner="dots")
-        self.current_status.start()
-
-    def update_status(self, message: str):
-        """Update the current status message."""
-        if self.current_status:
-            elapsed = time.time() - self.start_time if self.start_time else 0
-            status_text = f"🤖 {message} | {elapsed:.1f}s"
-            if self.llm_calls > 0:
-                status_text += f" | LLM: {self.llm_calls}"
-            if self.tool_calls > 0:
-                status_text += f" | Tools: {self.tool_calls}"
-            if self.total_tokens > 0:
-                status_text += f" | Tokens: {self.total_tokens}"
-            self.current_status.update(status_text)
-
-    def log_llm_call(self, tokens_used: int = 0):
-        """Log an LLM call."""
-        self.llm_calls += 1
-        if tokens_used > 0:
-            self.total_tokens += tokens_used
-        self.update_status("Processing...")
-
-    def log_tool_call(self, tool_name: str = ""):
-        """Log a tool call."""
-        self.tool_calls += 1
-        self.update_status(f"Using tool: {tool_name}" if tool_name else "Using tool...")
-
-    def track_agent_call(self, tokens: int = 0):
-        """Track agent calls and token usage."""
-        self.agent_metrics['calls'] += 1
-        self.agent_metrics['tokens'] += tokens
-
-    def stop_execution(self, success: bool = True, final_message: str = None):
-        """Stop execution and show final result."""
-        if self.current_status:
-            self.current_status.stop()
-
-        elapsed = time.time() - self.start_time if self.start_time else 0
-
-        if success:
-            result_text = "✅ Complete"
-        else:
-            result_text = "❌ Failed"
-
-        result_text += f" {elapsed:.1f}s"
-
-        # Add current directory
-        current_dir = os.path.basename(os.getcwd()) or "/"
-        result_text += f" | 📂 {current_dir}"
-
-        if self.llm_calls > 0:
-            result_text += f" | LLM: {self.llm_calls}"
-        if self.tool_calls > 0:
-            result_text += f" | Tools: {self.tool_calls}"
-        if self.total_tokens > 0:
-            result_text += f" | Tokens: {self.total_tokens}"
-
-        if final_message:
-            result_text += f" | {final_message}"
-
-        console.print(result_text)
-        self.current_status = None
-        self.callback_handler = None
-
-
-#====================================================================================================
-# UI / Prompting Functions
-#====================================================================================================
-
-
-async def async_prompt_user_silent(choices: List[str], default: str = None, command: str = None) -> str:
-    """Interactive prompt with visual arrow indicator for selected option."""
-
-    # Choice configuration with colors
-    choice_config = {
-        "yes": {"label": "✅ Yes", "desc": "Execute the command as shown", "color": "green"},
-        "no": {"label": "❌ No", "desc": "Cancel command execution", "color": "red"},
-        "modify": {"label": "✏️  Modify", "desc": "Edit the command before execution", "color": "yellow"},
-        "explain": {"label": "❓ Explain", "desc": "Ask agent to explain the command", "color": "blue"}
-    }
-
-    def display_static_confirmation():
-        """Display confirmation panel once - no updates until selection made."""
-        content_lines = Text()
-
-        # Add command info if provided
-        if command:
-            command_text = Text()
-            command_text.append("Command: ", style="bold cyan")
-            command_text.append(f"`{command}`", style="bold yellow")
-            content_lines.append(command_text)
-            content_lines.append("\n")
-
-        # Add choices (no arrow initially)
-        for i, choice in enumerate(choices):
-            config = choice_config.get(choice.lower(), {"label": choice, "desc": "", "color": "white"})
-            line = Text()
-            line.append("    ", style="white")
-            line.append(f"{i+1}. {config['label']}", style=config['color'])
-            if config['desc']:
-                line.append(f" - {config['desc']}", style="white dim")
-            line.append("\n")
-            content_lines.append(line)
-
-        # Instructions
-        instructions = Text()
-        instructions.append("Press 1-4", style="cyan bold")
-        instructions.append(" or use ", style="white dim")
-        instructions.append("↑/↓ arrows", style="cyan bold")
-        instructions.append(" and ", style="white dim")
-        instructions.append("Enter", style="red bold")
-        instructions.append(" to select\n", style="white dim")
-        content_lines.append(instructions)
-
-        # Display the panel once
-        unified_panel = Panel(
-            content_lines,
-            title="🤖 Confirm Agent Command",
-            title_align="left",
-            border_style="cyan"
-        )
-        console.print(unified_panel)
-
-    def get_keypress_choice() -> str:
-        fd = sys.stdin.fileno()
-        selected_index = 0  # Initialize locally
-
-        try:
-            # Display confirmation panel once
-            display_static_confirmation()
-
-            # display the default choice
-            config = choice_config.get(choices[selected_index].lower(), {"label": choices[selected_index], "desc": "", "color": "white"})
-            print(f"\r\033[K▶ {selected_index + 1}. {config['label']}", end='', flush=True)
-
-            while True:
-                key = sys.stdin.read(1)
-
-                # Number key shortcuts
-                if key in ['1', '2', '3', '4']:
-                    idx = int(key) - 1
-                    if idx < len(choices):
-                        return choices[idx]
-
-                # Arrow keys - track selection and show simple feedback
-                elif key == '\x1b':
-                    key += sys.stdin.read(2)
-                    if key == '\x1b[A':  # Up
-                        selected_index = (selected_index - 1) % len(choices)
-                        config = choice_config.get(choices[selected_index].lower(), {"label": choices[selected_index], "color": "white"})
-                        print(f"\r\033[K▶ {selected_index + 1}. {config['label']}", end='', flush=True)
-                    elif key == '\x1b[B':  # Down
-                        selected_index = (selected_index + 1) % len(choices)
-                        config = choice_config.get(choices[selected_index].lower(), {"label": choices[selected_index], "color": "white"})
-                        print(f"\r\033[K▶ {selected_index + 1}. {config['label']}", end='', flush=True)
-
-                # Enter key
-                elif key in ['\r', '\n']:
-                    print('\r\033[K', end='', flush=True)
-                    return choices[selected_index]
-
-                # Ctrl+C
-                elif key == '\x03':
-                    raise KeyboardInterrupt()
-
-        finally:
-            pass
-
-    # Get choice asynchronously
-    loop = asyncio.get_event_loop()
-    selected_choice = await loop.run_in_executor(None, get_keypress_choice)
-
-    # Show clean selection result in console history
-    config = choice_config.get(selected_choice.lower(), {"label": selected_choice, "color": "white"})
-    console.print(f"[green bold]✅ Selected: {config['label']}[/green bold]")
-
-    return selected_choice
+def get_splash_screen() -> str:
+    """Get the da_code ASCII splash screen."""
+    return _SPLASH
 
 
-def display_simple_confirmation(execution) -> None:
-    """Display simplified command confirmation panel using UserResponse enum."""
-    # Build content
-    content = []
-
-    # Command info section
-    command_text = Text()
-    command_text.append("Command: ", style="bold cyan")
-    command_text.append(execution.command, style="bold white")
-    content.append(str(command_text))
+def get_random_taglines() -> Tuple[str, ...]:
+    """Get random taglines for variety."""
+    return _TAGLINES
 
-    # Add separator
-    content.append("")
 
-    # Complete choice display using all UserResponse enum values
-    choices = [
-        ("✅ Yes", "Execute the command as shown"),
-        ("❌ No", "Cancel command execution"),
-        ("✏️ Modify", "Edit the command before execution"),
-        ("❓ Explain", "Ask agent to explain the command")
-    ]
-
-    for i, (label, desc) in enumerate(choices):
-        choice_line = Text()
-        choice_line.append(f"  {i+1}. {label}", style="bold")
-        choice_line.append(f" - {desc}", style="white dim")
-        content.append(str(choice_line))
+def get_mini_splash() -> str:
+    """Get a smaller splash for quick starts."""
+    return _MINI_SPLASH
 
-    # Add instructions
-    content.append("")
-    instructions = Text()
-    instructions.append("Press ", style="white dim")
-    instructions.append("1-4", style="cyan bold")
-    instructions.append(" or use ", style="white dim")
-    instructions.append("↑/↓ arrows", style="cyan bold")
-    instructions.append(" + ", style="white dim")
-    instructions.append("Enter", style="green bold")
-    content.append(str(instructions))
 
-    # Create panel
-    panel = Panel(
-        "\n".join(content),
-        title="🤖 Command Confirmation",
-        title_align="left",
-        border_style="cyan",
-        padding=(1, 2)
-    )
+def get_status_splash() -> str:
+    """Get splash screen for status/setup commands."""
+    return _STATUS_SPLASH
 
-    console.print(panel)
 
+# ANSI color codes for the single-color splash styles
+_STYLE_COLORS = {"blue": "94", "cyan": "96", "green": "92", "yellow": "93", "purple": "95"}
 
-async def async_prompt_text(message: str, default: str = None) -> str:
-    """Async wrapper for Rich text prompts."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        None,
-        lambda: Prompt.ask(message, default=default)
-    )
 
+def _color_text(text: str, color_code: str) -> str:
+    """Wrap text in an ANSI color, newline-terminated like print()."""
+    return f"\033[{color_code}m{text}\033[0m\n"
 
-async def confirmation_handler(execution: CommandExecution, status_interface: SimpleStatusInterface) -> ConfirmationResponse:
-    """Handle command confirmation directly."""
-    # Stop status to show confirmation dialog cleanly
-    status_interface.stop_execution()
 
-    # Get user choice using enum values with command display
-    response = await async_prompt_user_silent([
-        UserResponse.YES.value.title(),    # "Yes"
-        UserResponse.NO.value.title(),     # "No"
-        UserResponse.MODIFY.value.title(), # "Modify"
-        UserResponse.EXPLAIN.value.title() # "Explain"
-    ], default=UserResponse.YES.value.title(), command=execution.command)
-
-    modified_command = None
-    if response.lower() == UserResponse.MODIFY.value:
-        # Get modified command from user
-        modified_command = await async_prompt_text("Enter modified command", default=execution.command)
-        if not modified_command:
-            response = UserResponse.NO.value.title()
+def _gradient_text(text: str) -> str:
+    """Color each line of text along a blue gradient."""
+    lines = text.split('\n')
+    # True blue gradient: dark blue -> bright blue -> cyan
+    colors = ["34", "94", "94", "96", "96", "36", "36", "96"]
+    return ''.join(f"\033[{colors[i % len(colors)]}m{line}\033[0m\n" for i, line in enumerate(lines))
 
-    # Restart status interface for continued execution
-    status_interface.start_execution("Processing...")
 
-    # Convert response back to enum value for consistency
-    response_lower = response.lower()
-    if response_lower == "yes":
-        enum_choice = UserResponse.YES.value
-    elif response_lower == "no":
-        enum_choice = UserResponse.NO.value
-    elif response_lower == "modify":
-        enum_choice = UserResponse.MODIFY.value
-    elif response_lower == "explain":
-        enum_choice = UserResponse.EXPLAIN.value
+@lru_cache(maxsize=None)
+def _render_splash(text: str, style: str, encoding: str) -> bytes:
+    """Apply a splash style once and keep the encoded result."""
+    if style == "gradient":
+        rendered = _gradient_text(text)
+    elif style in _STYLE_COLORS:
+        rendered = _color_text(text, _STYLE_COLORS[style])
     else:
-        enum_choice = UserResponse.NO.value  # Default fallback
-
-    return ConfirmationResponse(
-        choice=enum_choice,
-        modified_command=modified_command
-    )
-
-
-#====================================================================================================
-# Splash Screen Functions
-#====================================================================================================
-
-
-def get_splash_screen() -> str:
-    """Get the da_code ASCII splash screen."""
-    ascii_art = r"""
-██████╗  █████╗      ██████╗ ██████╗ ██████╗ ███████╗
-██╔══██╗██╔══██╗    ██╔════╝██╔═══██╗██╔══██╗██╔════╝
-██║  ██║███████║    ██║     ██║   ██║██║  ██║█████╗
-██║  ██║██╔══██║    ██║     ██║   ██║██║  ██║██╔══╝
-██████╔╝██║  ██║    ╚██████╗╚██████╔╝██████╔╝███████╗
-╚═════╝ ╚═╝  ╚═╝     ╚═════╝ ╚═════╝ ╚═════╝ ╚══════╝
-
-    🤖 Agentic CLI with Agno & Azure OpenAI 🚀
-    """
-    return ascii_art
-
-
-def get_random_taglines() -> List[str]:
-    """Get random taglines for variety."""
-    return [
-        "🤖 Agentic CLI with Agno & Azure OpenAI 🚀",
-        "🧠 AI-Powered Command Line Assistant 🔧",
-        "⚡ Smart Automation with Human Oversight 🛡️",
-        "🎯 Precision Coding with AI Intelligence 💡",
-        "🔬 Advanced AI Tooling for Developers 🚀",
-        "🌟 Next-Gen CLI Experience 🤖",
-        "⚙️  Intelligent Command Execution 🎪",
-        "🎨 Where AI Meets Development Workflow 🔥"
-    ]
-
+        # Default - no colors
+        rendered = f"{text}\n"
+    return rendered.encode(encoding, errors="replace")
 
-def get_mini_splash() -> str:
-    """Get a smaller splash for quick starts."""
-    return r"""
-██████╗  █████╗ ██████╗
-██╔══██╗██╔══██╗██╔════╝
-██║  ██║███████║██║
-██║  ██║██╔══██║██║
-██████╔╝██║  ██║╚██████╗
-╚═════╝ ╚═╝  ╚═╝ ╚═════╝
-🤖 Your AI Coding Assistant 🚀
-"""
 
+def _write_splash(text: str, style: str) -> None:
+    """Write a styled splash to stdout as one pre-encoded chunk."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # stdout was replaced by a text-only stream
+        sys.stdout.write(_render_splash(text, style, "utf-8").decode("utf-8"))
+        return
 
-def get_status_splash() -> str:
-    """Get splash screen for status/setup commands."""
-    return r"""
-    ╔═════════════════════════════════╗
-    ║     ██████╗  █████╗ ██████╗     ║
-    ║     ██╔══██╗██╔══██╗██╔════╝    ║
-    ║     ██║  ██║███████║██║         ║
-    ║     ██║  ██║██╔══██║██║         ║
-    ║     ██████╔╝██║  ██╚██████╗     ║
-    ║     ╚═════╝ ╚═╝  ╚═╝╚═════╝     ║
-    ╚═════════════════════════════════╝
-    """
+    sys.stdout.flush()
+    buffer.write(_render_splash(text, style, sys.stdout.encoding or "utf-8"))
+    buffer.flush()
 
 
 def print_with_colors(text: str, color_code: str = "94") -> None:
     """Print text with ANSI colors."""
-    print(f"\033[{color_code}m{text}\033[0m")
+    sys.stdout.write(_color_text(text, color_code))
 
 
 def print_gradient_splash(text: str) -> None:
     """Print splash with gradient effect."""
-    lines = text.split('\n')
-    # True blue gradient: dark blue -> bright blue -> cyan
-    colors = ["34", "94", "94", "96", "96", "36", "36", "96"]
-
-    for i, line in enumerate(lines):
-        color = colors[i % len(colors)]
-        print(f"\033[{color}m{line}\033[0m")
+    # Build the whole splash and emit it with a single write
+    sys.stdout.write(_gradient_text(text))
 
 
 def print_rainbow_splash(text: str) -> None:
@@ -857,12 +464,11 @@ def print_rainbow_splash(text: str) -> None:
     lines = text.split('\n')
     rainbow_colors = ["91", "93", "92", "96", "94", "95"]
 
-    for i, line in enumerate(lines):
-        if line.strip():  # Only color non-empty lines
-            color = rainbow_colors[i % len(rainbow_colors)]
-            print(f"\033[{color}m{line}\033[0m")
-        else:
-            print(line)
+    # Only color non-empty lines; emit everything with a single write
+    sys.stdout.write(''.join(
+        f"\033[{rainbow_colors[i % len(rainbow_colors)]}m{line}\033[0m\n" if line.strip() else f"{line}\n"
+        for i, line in enumerate(lines)
+    ))
 
 
 def show_splash(style: str = "default", mini: bool = False) -> None:
@@ -870,30 +476,12 @@ def show_splash(style: str = "default", mini: bool = False) -> None:
     if mini:
         splash = get_mini_splash()
     else:
-        splash = get_splash_screen()
         # Add random tagline
-        taglines = get_random_taglines()
-        random_tagline = random.choice(taglines)
-        splash = splash.replace("🤖 Agentic CLI with Agno & Azure OpenAI 🚀", random_tagline)
+        splash = _SPLASH_TEMPLATE.format(tagline=random.choice(_TAGLINES))
 
-    # Apply styling
-    if style == "gradient":
-        print_gradient_splash(splash)
-    elif style == "blue":
-        print_with_colors(splash, "94")
-    elif style == "cyan":
-        print_with_colors(splash, "96")
-    elif style == "green":
-        print_with_colors(splash, "92")
-    elif style == "yellow":
-        print_with_colors(splash, "93")
-    elif style == "purple":
-        print_with_colors(splash, "95")
-    else:
-        # Default - no colors
-        print(splash)
+    _write_splash(splash, style)
 
 
 def show_status_splash() -> None:
     """Show splash for status/configuration commands."""
-    print_with_colors(get_status_splash(), "96")
+    _write_splash(get_status_splash(), "cyan")
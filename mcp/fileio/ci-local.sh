@@ -86,6 +86,7 @@ fi
 # Step 6: Unit Tests
 print_step "Running unit tests..."
 if pytest tests/test_file_operations_sync.py tests/test_file_operations_async.py \
+    tests/test_directory_operations_search.py \
     -v \
     --cov=. \
     --cov-report=term-missing \
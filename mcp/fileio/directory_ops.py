@@ -1,20 +1,53 @@
 """Directory operations tools for FileIO MCP Server."""
 
+import asyncio
 import json
+import stat
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from mcp import types
 
 from models import FileIOConfig
-from utils import create_file_info, human_size, safe_json_dumps
+from utils import OFFLOAD_READ_BYTES, create_file_info, human_size, safe_json_dumps
 
 
 class DirectoryOperations:
     """Handle directory-level operations."""
 
+    # Content search reads files this many characters at a time
+    SEARCH_CHUNK_CHARS = 64 * 1024
+
+    # Content search only opens these text types, and never these generated files
+    SEARCHABLE_SUFFIXES = frozenset(
+        {
+            ".txt",
+            ".md",
+            ".json",
+            ".yaml",
+            ".yml",
+            ".log",
+            ".csv",
+            ".py",
+            ".js",
+            ".html",
+            ".css",
+            ".xml",
+        }
+    )
+    SKIPPED_FILENAMES = frozenset({"package-lock.json", "yarn.lock", "poetry.lock"})
+
+    # A NUL in the first bytes marks a file as binary
+    BINARY_PROBE_CHARS = 8192
+
     def __init__(self, config: FileIOConfig):
         self.config = config
+        self._handlers = {
+            "list_files": self._list_files,
+            "get_directory_tree": self._get_directory_tree,
+            "get_directory_stats": self._get_directory_stats,
+            "search_files": self._search_files,
+        }
 
     def get_tools(self) -> List[types.Tool]:
         """Get list of available directory operation tools."""
@@ -144,18 +177,12 @@ class DirectoryOperations:
     async def execute(self, name: str, arguments: dict) -> List[types.TextContent]:
         """Execute directory operation tool."""
         try:
-            if name == "list_files":
-                return await self._list_files(arguments)
-            elif name == "get_directory_tree":
-                return await self._get_directory_tree(arguments)
-            elif name == "get_directory_stats":
-                return await self._get_directory_stats(arguments)
-            elif name == "search_files":
-                return await self._search_files(arguments)
-            else:
+            handler = self._handlers.get(name)
+            if handler is None:
                 return [
                     types.TextContent(type="text", text=f"Unknown operation: {name}")
                 ]
+            return await handler(arguments)
         except Exception as e:
             return [types.TextContent(type="text", text=f"Error in {name}: {str(e)}")]
 
@@ -183,10 +210,12 @@ class DirectoryOperations:
                 file_list.append(info)
             else:
                 rel_path = file_path.relative_to(dir_path)
-                file_type = "📁" if file_path.is_dir() else "📄"
-                size = (
-                    human_size(file_path.stat().st_size) if file_path.is_file() else ""
-                )
+                try:
+                    st = file_path.stat()
+                except OSError:
+                    st = None
+                file_type = "📁" if st and stat.S_ISDIR(st.st_mode) else "📄"
+                size = human_size(st.st_size) if st and stat.S_ISREG(st.st_mode) else ""
                 file_list.append(f"{file_type} {rel_path} {size}".strip())
 
         if not file_list:
@@ -279,9 +308,11 @@ class DirectoryOperations:
 
         for item in iterator:
             try:
-                if item.is_file():
+                # One stat answers the type, size and mtime questions
+                st = item.stat()
+                if stat.S_ISREG(st.st_mode):
                     stats["total_files"] += 1
-                    size = item.stat().st_size
+                    size = st.st_size
                     stats["total_size"] += size
 
                     # Track file types
@@ -293,11 +324,11 @@ class DirectoryOperations:
                         {
                             "path": str(item.relative_to(self.config.base_path)),
                             "size": size,
-                            "modified": item.stat().st_mtime,
+                            "modified": st.st_mtime,
                         }
                     )
 
-                elif item.is_dir():
+                elif stat.S_ISDIR(st.st_mode):
                     stats["total_directories"] += 1
 
             except (PermissionError, OSError):
@@ -322,6 +353,32 @@ class DirectoryOperations:
             )
         ]
 
+    def _first_match_line(
+        self, file_path: Path, needle: str, case_sensitive: bool
+    ) -> Optional[int]:
+        """Line number of the first occurrence of needle, or None if absent or binary.
+
+        The file is read in chunks, so reading stops at the first hit and
+        memory stays bounded by the chunk size rather than the file size.
+        """
+        keep = len(needle) - 1
+        lines_before = 0
+        tail = ""
+        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
+            chunk = f.read(self.SEARCH_CHUNK_CHARS)
+            if "\x00" in chunk[: self.BINARY_PROBE_CHARS]:
+                return None
+            while chunk:
+                # Carry the last len(needle) - 1 chars so matches across chunks are found
+                buf = tail + (chunk if case_sensitive else chunk.lower())
+                match_at = buf.find(needle)
+                if match_at != -1:
+                    return lines_before + buf.count("\n", 0, match_at) + 1
+                tail = buf[-keep:] if keep else ""
+                lines_before += buf.count("\n", 0, len(buf) - len(tail))
+                chunk = f.read(self.SEARCH_CHUNK_CHARS)
+        return None
+
     async def _search_files(self, args: dict) -> List[types.TextContent]:
         """Search for files by name or content."""
         dir_path = self.config.base_path / args["directory"]
@@ -365,41 +422,29 @@ class DirectoryOperations:
                 if len(results) >= max_results:
                     break
 
-                if not file_path.is_file():
-                    continue
-
-                # Only search text files
-                if file_path.suffix.lower() not in [
-                    ".txt",
-                    ".md",
-                    ".json",
-                    ".yaml",
-                    ".yml",
-                    ".log",
-                    ".csv",
-                ]:
+                # Only search text files, skipping generated lockfiles
+                if (
+                    file_path.suffix.lower() not in self.SEARCHABLE_SUFFIXES
+                    or file_path.name in self.SKIPPED_FILENAMES
+                ):
                     continue
 
                 try:
-                    # Check file size
-                    if file_path.stat().st_size > self.config.max_file_size:
+                    # Check type and size
+                    st = file_path.stat()
+                    if not stat.S_ISREG(st.st_mode) or st.st_size > self.config.max_file_size:
                         continue
 
-                    content = file_path.read_text(encoding="utf-8", errors="ignore")
-                    search_content = content if case_sensitive else content.lower()
-
-                    if search_pattern in search_content:
-                        # Find line number of first match
-                        lines = search_content.split("\n")
-                        line_num = next(
-                            (
-                                i + 1
-                                for i, line in enumerate(lines)
-                                if search_pattern in line
-                            ),
-                            1,
+                    if st.st_size > OFFLOAD_READ_BYTES:
+                        line_num = await asyncio.to_thread(
+                            self._first_match_line, file_path, search_pattern, case_sensitive
+                        )
+                    else:
+                        line_num = self._first_match_line(
+                            file_path, search_pattern, case_sensitive
                         )
 
+                    if line_num is not None:
                         results.append(
                             {
                                 "type": "content_match",
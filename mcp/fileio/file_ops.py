@@ -1,5 +1,6 @@
 """File operations tools for FileIO MCP Server."""
 
+import asyncio
 import fcntl
 import json
 import os
@@ -13,15 +14,37 @@ from typing import List, Optional
 from mcp import types
 
 from models import FileIOConfig
-from utils import create_file_info, safe_json_dumps, validate_file_extension
+from utils import (
+    OFFLOAD_READ_BYTES,
+    create_file_info,
+    safe_json_dumps,
+    validate_file_extension,
+)
 
 
 class FileOperations:
     """Handle file-level operations."""
 
+    # Operations that are only dispatched while the matching security flag is on
+    WRITE_OPERATIONS = frozenset({"write_file", "append_to_file"})
+    DELETE_OPERATIONS = frozenset({"delete_file"})
+
     def __init__(self, config: FileIOConfig):
         self.config = config
         self._file_locks = {}  # Track active file locks
+        self._handlers = {
+            "read_file": self._read_file,
+            "get_file_info": self._get_file_info,
+            "check_file_exists": self._check_file_exists,
+            "write_file": self._write_file,
+            "append_to_file": self._append_to_file,
+            "delete_file": self._delete_file,
+            "copy_file": self._copy_file,
+            "move_file": self._move_file,
+            "compress_file": self._compress_file,
+            "extract_file": self._extract_file,
+            "file_lock": self._file_lock,
+        }
 
     @contextmanager
     def _acquire_file_lock(self, file_path: Path, timeout: float = 30.0):
@@ -415,34 +438,19 @@ class FileOperations:
     async def execute(self, name: str, arguments: dict) -> List[types.TextContent]:
         """Execute file operation tool."""
         try:
-            if name == "read_file":
-                return await self._read_file(arguments)
-            elif name == "get_file_info":
-                return await self._get_file_info(arguments)
-            elif name == "check_file_exists":
-                return await self._check_file_exists(arguments)
-            elif name == "write_file" and self.config.security.enable_write:
-                return await self._write_file(arguments)
-            elif name == "append_to_file" and self.config.security.enable_write:
-                return await self._append_to_file(arguments)
-            elif name == "delete_file" and self.config.security.enable_delete:
-                return await self._delete_file(arguments)
-            elif name == "copy_file":
-                return await self._copy_file(arguments)
-            elif name == "move_file":
-                return await self._move_file(arguments)
-            elif name == "compress_file":
-                return await self._compress_file(arguments)
-            elif name == "extract_file":
-                return await self._extract_file(arguments)
-            elif name == "file_lock":
-                return await self._file_lock(arguments)
-            else:
+            handler = self._handlers.get(name)
+            # Security flags are read at call time so config changes still apply
+            if (
+                handler is None
+                or (name in self.WRITE_OPERATIONS and not self.config.security.enable_write)
+                or (name in self.DELETE_OPERATIONS and not self.config.security.enable_delete)
+            ):
                 return [
                     types.TextContent(
                         type="text", text=f"Unknown or disabled operation: {name}"
                     )
                 ]
+            return await handler(arguments)
         except Exception as e:
             return [types.TextContent(type="text", text=f"Error in {name}: {str(e)}")]
 
@@ -467,7 +475,8 @@ class FileOperations:
             ]
 
         # Check file size
-        if file_path.stat().st_size > self.config.max_file_size:
+        size = file_path.stat().st_size
+        if size > self.config.max_file_size:
             return [
                 types.TextContent(
                     type="text",
@@ -476,7 +485,12 @@ class FileOperations:
             ]
 
         try:
-            content = file_path.read_text(encoding=args.get("encoding", "utf-8"))
+            encoding = args.get("encoding", "utf-8")
+            if size > OFFLOAD_READ_BYTES:
+                content = await asyncio.to_thread(file_path.read_text, encoding=encoding)
+            else:
+                # Small reads finish faster inline than the thread hand-off costs
+                content = file_path.read_text(encoding=encoding)
             return [types.TextContent(type="text", text=content)]
         except UnicodeDecodeError:
             return [
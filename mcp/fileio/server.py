@@ -39,6 +39,20 @@ class FileIOMCPServer(BaseMCPServer):
         self.file_ops = FileOperations(self.config)
         self.dir_ops = DirectoryOperations(self.config)
 
+        # Tool schemas depend only on the config, so build the listing and routing tables once
+        file_tools = self.file_ops.get_tools()
+        dir_tools = self.dir_ops.get_tools()
+        self._tools_list = [
+            {
+                "name": tool.name,
+                "description": tool.description,
+                "inputSchema": tool.inputSchema,
+            }
+            for tool in (*file_tools, *dir_tools)
+        ]
+        self._file_tool_names = frozenset(tool.name for tool in file_tools)
+        self._dir_tool_names = frozenset(tool.name for tool in dir_tools)
+
     async def get_health_status(self) -> Dict[str, Any]:
         """Override health status to include FileIO-specific information."""
         base_status = await super().get_health_status()
@@ -53,29 +67,7 @@ class FileIOMCPServer(BaseMCPServer):
 
     async def handle_tools_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle tools/list request."""
-        tools = []
-
-        # Get tools from file operations
-        for tool in self.file_ops.get_tools():
-            tools.append(
-                {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "inputSchema": tool.inputSchema,
-                }
-            )
-
-        # Get tools from directory operations
-        for tool in self.dir_ops.get_tools():
-            tools.append(
-                {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "inputSchema": tool.inputSchema,
-                }
-            )
-
-        return {"tools": tools}
+        return {"tools": self._tools_list}
 
     async def handle_tools_call(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle tools/call request."""
@@ -88,12 +80,9 @@ class FileIOMCPServer(BaseMCPServer):
         self.logger.info(f"Executing tool: {tool_name} with args: {arguments}")
 
         # Route to appropriate handler
-        file_tool_names = [tool.name for tool in self.file_ops.get_tools()]
-        dir_tool_names = [tool.name for tool in self.dir_ops.get_tools()]
-
-        if tool_name in file_tool_names:
+        if tool_name in self._file_tool_names:
             result = await self.file_ops.execute(tool_name, arguments)
-        elif tool_name in dir_tool_names:
+        elif tool_name in self._dir_tool_names:
             result = await self.dir_ops.execute(tool_name, arguments)
         else:
             raise ValueError(f"Unknown tool: {tool_name}")
@@ -12,10 +12,9 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from config import FileIOConfig
+from models import FileIOConfig
 from directory_ops import DirectoryOperations
 from file_ops import FileOperations
-from mcp.fileio.server import MCPFileIOServer
 
 # Removed event_loop fixture as it conflicts with pytest-asyncio auto mode
 
@@ -86,10 +85,13 @@ def dir_ops(test_config: FileIOConfig) -> DirectoryOperations:
 @pytest.fixture
 async def mcp_server(
     test_config: FileIOConfig,
-) -> AsyncGenerator[MCPFileIOServer, None]:
+) -> AsyncGenerator["FileIOMCPServer", None]:
     """Create MCP server instance for testing."""
+    # Imported here so tests that don't need the server don't need basemcp on the path
+    from server import FileIOMCPServer
+
     # Mock MongoDB for tests
-    server = MCPFileIOServer.__new__(MCPFileIOServer)
+    server = FileIOMCPServer.__new__(FileIOMCPServer)
     server.config = test_config
     server.logger = MagicMock()
     server.mongodb_client = None
@@ -0,0 +1,101 @@
+"""Unit tests for DirectoryOperations content search."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from directory_ops import DirectoryOperations
+
+
+async def search_content(dir_ops: DirectoryOperations, pattern: str) -> list:
+    """Run a content search over ingress and return the matched paths."""
+    result = await dir_ops._search_files(
+        {"directory": "ingress", "content_pattern": pattern}
+    )
+    text = result[0].text
+    if not text.startswith("Search Results"):
+        return []
+    return sorted(Path(r["path"]).name for r in json.loads(text.split("\n", 1)[1]))
+
+
+def test_first_match_line_spans_chunk_boundary(
+    dir_ops: DirectoryOperations, temp_base_dir: Path
+):
+    """Test a match split across two chunks is found via the carried tail."""
+    dir_ops.SEARCH_CHUNK_CHARS = 8
+    file_path = temp_base_dir / "ingress" / "split.txt"
+    # "needle" straddles the 8-character boundary: "abcdenee" | "dle\n"
+    file_path.write_text("abcdeneedle\n")
+
+    assert dir_ops._first_match_line(file_path, "needle", True) == 1
+
+
+def test_first_match_line_counts_lines_across_chunks(
+    dir_ops: DirectoryOperations, temp_base_dir: Path
+):
+    """Test the line number stays correct after several chunks."""
+    dir_ops.SEARCH_CHUNK_CHARS = 8
+    file_path = temp_base_dir / "ingress" / "lines.txt"
+    lines = [f"line {i}" for i in range(20)] + ["the Needle here", "after"]
+    file_path.write_text("\n".join(lines) + "\n")
+
+    assert dir_ops._first_match_line(file_path, "needle", False) == 21
+    assert dir_ops._first_match_line(file_path, "Needle", True) == 21
+    assert dir_ops._first_match_line(file_path, "needle", True) is None
+
+
+def test_first_match_line_newline_in_carried_tail(
+    dir_ops: DirectoryOperations, temp_base_dir: Path
+):
+    """Test newlines inside the carried tail are counted exactly once."""
+    dir_ops.SEARCH_CHUNK_CHARS = 4
+    file_path = temp_base_dir / "ingress" / "tail.txt"
+    file_path.write_text("a\nb\nc\nd\nxyz\n")
+
+    assert dir_ops._first_match_line(file_path, "xyz", True) == 5
+
+
+def test_first_match_line_empty_needle(
+    dir_ops: DirectoryOperations, temp_base_dir: Path
+):
+    """Test an empty needle matches at the start of a file and never in an empty one."""
+    file_path = temp_base_dir / "ingress" / "text.txt"
+    file_path.write_text("first\nsecond\n")
+    empty_path = temp_base_dir / "ingress" / "empty.txt"
+    empty_path.touch()
+
+    assert dir_ops._first_match_line(file_path, "", True) == 1
+    assert dir_ops._first_match_line(empty_path, "", True) is None
+
+
+@pytest.mark.asyncio
+async def test_search_skips_binary_files(
+    dir_ops: DirectoryOperations, temp_base_dir: Path
+):
+    """Test a file with a NUL byte near the start is not searched."""
+    (temp_base_dir / "ingress" / "blob.txt").write_bytes(b"\x00\x01 needle\n")
+    (temp_base_dir / "ingress" / "plain.txt").write_text("a needle\n")
+
+    assert await search_content(dir_ops, "needle") == ["plain.txt"]
+
+
+@pytest.mark.asyncio
+async def test_search_skips_lockfiles(
+    dir_ops: DirectoryOperations, temp_base_dir: Path
+):
+    """Test generated lockfiles are skipped even though .json is searchable."""
+    (temp_base_dir / "ingress" / "package-lock.json").write_text('{"needle": 1}\n')
+    (temp_base_dir / "ingress" / "data.json").write_text('{"needle": 2}\n')
+
+    assert await search_content(dir_ops, "needle") == ["data.json"]
+
+
+@pytest.mark.asyncio
+async def test_search_includes_source_files(
+    dir_ops: DirectoryOperations, temp_base_dir: Path
+):
+    """Test an ordinary .py file is still searched."""
+    (temp_base_dir / "ingress" / "module.py").write_text("# needle\nx = 1\n")
+
+    assert await search_content(dir_ops, "needle") == ["module.py"]
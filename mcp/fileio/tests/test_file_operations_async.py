@@ -8,7 +8,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 from mcp import types
 
-from config import FileIOConfig
+from models import FileIOConfig
 from file_ops import FileOperations
 
 # All tests in this file are async - using pytest-asyncio auto mode
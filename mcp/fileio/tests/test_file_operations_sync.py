@@ -4,7 +4,7 @@ from pathlib import Path
 
 import pytest
 
-from config import FileIOConfig
+from models import FileIOConfig
 from file_ops import FileOperations
 
 
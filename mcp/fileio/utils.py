@@ -3,8 +3,12 @@
 import json
 from datetime import datetime
 from pathlib import Path
+from stat import S_ISDIR, S_ISREG
 from typing import Any, Dict, Union
 
+# Reads larger than this run in a worker thread so they don't stall the event loop
+OFFLOAD_READ_BYTES = 256 * 1024
+
 
 def human_size(bytes_size: int) -> str:
     """Convert bytes to human readable format."""
@@ -47,6 +51,8 @@ def create_file_info(file_path: Path, base_path: Path) -> Dict[str, Any]:
     """Create file information dictionary."""
     try:
         stat = file_path.stat()
+        # Derive the type from the stat already taken rather than stat-ing again
+        is_file = S_ISREG(stat.st_mode)
         return {
             "name": file_path.name,
             "path": str(file_path.relative_to(base_path)),
@@ -54,10 +60,10 @@ def create_file_info(file_path: Path, base_path: Path) -> Dict[str, Any]:
             "size_human": human_size(stat.st_size),
             "modified": format_timestamp(stat.st_mtime),
             "created": format_timestamp(stat.st_ctime),
-            "is_file": file_path.is_file(),
-            "is_directory": file_path.is_dir(),
+            "is_file": is_file,
+            "is_directory": S_ISDIR(stat.st_mode),
             "extension": file_path.suffix,
-            "mime_type": get_mime_type(file_path) if file_path.is_file() else None,
+            "mime_type": get_mime_type(file_path) if is_file else None,
         }
     except Exception as e:
         return {"name": file_path.name, "error": str(e)}
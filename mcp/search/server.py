@@ -9,6 +9,7 @@ from typing import Dict, List, Any, Optional
 from urllib.parse import urlparse, quote
 
 import httpx
+import orjson
 import feedparser
 from bs4 import BeautifulSoup
 import uvicorn
@@ -21,12 +22,17 @@ from mcp import types
 from basemcp.server import BaseMCPServer
 from models import SearchResult, ContentExtraction
 
+logger = logging.getLogger(__name__)
+
 class SearchEngine:
     """Handle different search engines and APIs."""
 
     def __init__(self):
+        # HTTP/2 lets the instant-answer and HTML fallback requests share one connection
         self.client = httpx.AsyncClient(
-            timeout=30.0,
+            http2=True,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=5, keepalive_expiry=30.0),
             headers={
                 "User-Agent": "Mozilla/5.0 (compatible; SearchMCP/1.0)"
             }
@@ -41,7 +47,8 @@ class SearchEngine:
 
             response = await self.client.get(url)
             response.raise_for_status()
-            data = response.json()
+            # orjson parses the body bytes directly, skipping the str decode
+            data = orjson.loads(response.content)
 
             results = []
 
@@ -84,7 +91,7 @@ class SearchEngine:
             response = await self.client.get(url)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, 'lxml')  # C parser, already a declared dependency
             results = []
 
             for result_div in soup.find_all('div', class_='result')[:num_results]:
@@ -158,7 +165,7 @@ class SearchEngine:
             response = await self.client.get(url)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, 'lxml')
 
             # Remove script and style elements
             for script in soup(["script", "style"]):
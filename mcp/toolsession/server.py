@@ -117,13 +117,11 @@ class ToolSessionOperations:
             return True
 
         try:
-            # Change to working directory
-            os.chdir(self.working_dir)
-
-            # Start the process
+            # Start the process in the working directory
             self.process = subprocess.Popen(
                 self.command,
                 shell=True,
+                cwd=self.working_dir,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,